@@ -1,69 +1,193 @@
 """Module for audio data handling in OpenVoicePacks."""
 
+import io
 import logging
+import math
+import os
+import wave
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
-from pydub import AudioSegment
+import audioop
 
 from openvoicepacks.utils import validate_file_path
 
 _logger = logging.getLogger(__name__)
 
+# Names used by ffmpeg/pydub for compressed formats, where they differ from ours.
+_PYDUB_FORMATS = {"ogg_vorbis": "ogg"}
 
-@dataclass
+# Length of the low-pass filter applied before downsampling, and where its cutoff
+# sits as a fraction of the output Nyquist frequency, to leave room for the
+# filter's transition band.
+_ANTI_ALIAS_TAPS = 63
+_ANTI_ALIAS_CUTOFF = 0.9
+
+
+def _low_pass(
+    data: bytes | memoryview, width: int, channels: int, cutoff: float
+) -> bytes:
+    """Return PCM audio with frequencies above a cutoff filtered out.
+
+    A Hamming-windowed sinc filter is applied, built from audioop's C sample
+    operations: each tap scales a shifted copy of the audio, and the copies are
+    summed. The sum is done at 32-bit width with headroom, so it cannot clip.
+
+    Args:
+        data (bytes | memoryview): The PCM audio samples.
+        width (int): The sample width in bytes.
+        channels (int): The number of interleaved channels.
+        cutoff (float): The cutoff frequency, as a fraction of the sample rate.
+
+    Returns:
+        bytes: The filtered PCM audio, the same length as the input.
+    """
+    middle = _ANTI_ALIAS_TAPS // 2
+    taps = []
+    for n in range(_ANTI_ALIAS_TAPS):
+        x = 2 * math.pi * cutoff * (n - middle)
+        sinc = math.sin(x) / x if x else 1.0
+        window = 0.54 - 0.46 * math.cos(2 * math.pi * n / (_ANTI_ALIAS_TAPS - 1))
+        taps.append(sinc * window)
+    gain = sum(taps)  # Normalise the taps, to pass low frequencies unchanged
+
+    # Widen to 32-bit with 1/8 headroom, then pad so the filter stays centred.
+    samples = audioop.mul(audioop.lin2lin(data, width, 4), 4, 1 / 8)
+    frame = 4 * channels
+    padding = b"\0" * (middle * frame)
+    padded = padding + samples + padding
+    size = len(samples)
+
+    filtered = b"\0" * size
+    for n, tap in enumerate(taps):
+        shifted = padded[n * frame : n * frame + size]
+        filtered = audioop.add(filtered, audioop.mul(shifted, 4, tap / gain), 4)
+    return audioop.lin2lin(audioop.mul(filtered, 4, 8), 4, width)
+
+
+@dataclass(slots=True, frozen=True)
 class AudioData:
     """Encapsulates audio data and its properties for encoding/decoding.
 
+    AudioData is immutable, so the audio buffer can be shared without copying.
+
     Args:
-        data (bytes): The raw audio byte data.
+        data (bytes | memoryview): The raw audio byte data, or a byte view over a
+            buffer owned by the provider.
         rate (int, optional): The sample rate of the audio data.
             Defaults to 16000 Hz.
         width (int, optional): The sample width in bytes.
             Defaults to 2 bytes (16-bit audio).
         channels (int, optional): The number of audio channels.
             Defaults to 1 (mono).
+        format (str, optional): The encoding of the audio data, either "pcm" for raw
+            samples or a compressed format ("mp3" or "ogg_vorbis"), which is decoded
+            when writing WAVE data. Defaults to "pcm".
     """
 
-    data: bytes
+    data: bytes | memoryview
     rate: int = 16000
     width: int = 2
     channels: int = 1
+    format: str = "pcm"
+
+    def pcm(self) -> "AudioData":
+        """Return the audio as raw PCM samples, decoding it if it is compressed.
+
+        Decoding compressed audio uses ffmpeg via pydub.
+
+        Returns:
+            AudioData: This object if already PCM, otherwise a decoded copy.
+        """
+        if self.format == "pcm":
+            return self
+
+        # See: https://github.com/jiaaro/pydub/blob/master/API.markdown
+        from pydub import AudioSegment  # NOQA: PLC0415
+
+        sound = AudioSegment.from_file(
+            io.BytesIO(self.data), format=_PYDUB_FORMATS.get(self.format, self.format)
+        )
+        return AudioData(
+            data=sound.raw_data,
+            rate=sound.frame_rate,
+            width=sound.sample_width,
+            channels=sound.channels,
+        )
 
-    def write_wav(self, file: str | Path, output_rate: int = 16000) -> str | Path:
+    def write_wav(
+        self, file: str | Path | BinaryIO, output_rate: int = 16000
+    ) -> str | Path | BinaryIO:
         """Write WAVE-encoded audio data to a file path or file-like object.
 
         Args:
-            file (str or Path): File path or file-like object to write audio data to.
+            file (str, Path or BinaryIO): File path or binary file-like object to
+                write audio data to.
             output_rate (int, optional): The sample rate to write the audio data at.
                 Defaults to 16000 Hz.
 
         Returns:
-            str | Path: The file path or file-like object written to.
+            str | Path | BinaryIO: The file path or file-like object written to.
         """
-        validate_file_path(file)
+        if isinstance(file, (str, os.PathLike)):
+            validate_file_path(file)
         if not isinstance(output_rate, int) or output_rate <= 0:
             raise ValueError("output_rate must be a positive integer")
 
-        # Uses ffmpeg via pydub to write the WAV file
-        # See: https://github.com/jiaaro/pydub/blob/master/API.markdown
-        sound = AudioSegment(
-            data=self.data,
-            sample_width=self.width,
-            frame_rate=self.rate,
-            channels=self.channels,
-        )
-        sound.export(
-            file,
-            format="wav",
-            bitrate="16k",
-            parameters=["-ar", str(output_rate)],
+        # wave opens file names itself, and writes file-like objects directly
+        self._write_frames(
+            os.fspath(file) if isinstance(file, (str, os.PathLike)) else file,
+            output_rate,
         )
-        _logger.debug('Wrote audio data to "%s"', str(file))
+        _logger.debug('Wrote audio data to "%s"', file)
         return file
 
+    def to_wav_bytes(self, output_rate: int = 16000) -> bytes:
+        """Return the audio data as a WAVE-encoded bytes object.
+
+        Args:
+            output_rate (int, optional): The sample rate to encode the audio data at.
+                Defaults to 16000 Hz.
+
+        Returns:
+            bytes: The WAVE-encoded audio data.
+        """
+        if not isinstance(output_rate, int) or output_rate <= 0:
+            raise ValueError("output_rate must be a positive integer")
 
-@dataclass
+        buffer = io.BytesIO()
+        self._write_frames(buffer, output_rate)
+        return buffer.getvalue()
+
+    def _write_frames(self, file: str | BinaryIO, output_rate: int) -> None:
+        """Write the audio data as WAVE to a file name or binary file-like object."""
+        audio = self.pcm()
+        # The PCM data goes from memory to the file in a single pass, plus passes to
+        # resample when needed. audioop is a C extension, so PCM audio never needs an
+        # ffmpeg process. ratecv only interpolates, so audio is low-pass filtered
+        # before downsampling to stop higher frequencies aliasing.
+        data = audio.data
+        if output_rate < audio.rate:
+            data = _low_pass(
+                data,
+                audio.width,
+                audio.channels,
+                _ANTI_ALIAS_CUTOFF * output_rate / (2 * audio.rate),
+            )
+        if output_rate != audio.rate:
+            data, _ = audioop.ratecv(
+                data, audio.width, audio.channels, audio.rate, output_rate, None
+            )
+
+        with wave.open(file, "wb") as wav:
+            wav.setnchannels(audio.channels)
+            wav.setsampwidth(audio.width)
+            wav.setframerate(output_rate)
+            wav.writeframesraw(data)
+
+
+@dataclass(slots=True)
 class SoundFile:
     """Represents a single sound asset, including text, audio, and path.
 
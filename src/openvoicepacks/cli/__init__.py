@@ -0,0 +1,5 @@
+"""Subcommands for the OpenVoicePacks command line interface.
+
+Each module holds a single command. Commands are registered on the ovp group in
+openvoicepacks.client and are only imported when they are invoked.
+"""
@@ -0,0 +1,122 @@
+"""Build command for the OpenVoicePacks CLI."""
+
+import json
+import threading
+import zipfile
+from pathlib import Path
+
+import click
+
+from openvoicepacks.audio import SoundFile
+from openvoicepacks.providers import Provider
+from openvoicepacks.voicemodel import VoiceModel
+from openvoicepacks.voicepack import VoicePack, voicepack_from_csv, voicepack_from_yaml
+from openvoicepacks.worker import process_queue
+
+
+def load_voicepack(filepath: str | Path) -> VoicePack:
+    """Load a voice pack from a YAML, JSON or CSV file.
+
+    Args:
+        filepath (str | Path): Path to the voice pack config file.
+
+    Returns:
+        VoicePack: The loaded voice pack.
+    """
+    filepath = Path(filepath)
+    match filepath.suffix.lower():
+        case ".csv":
+            # CSV files are streamed row by row rather than read whole.
+            return voicepack_from_csv(filepath)
+        case ".json":
+            return VoicePack(**json.loads(filepath.read_text(encoding="utf-8")))
+        case _:
+            return voicepack_from_yaml(filepath)
+
+
+def write_zip(
+    provider: Provider,
+    model: VoiceModel,
+    sound_files: list[SoundFile],
+    zip_path: Path,
+) -> list[SoundFile]:
+    """Synthesise sound files straight into a zip archive.
+
+    Audio is encoded in memory and written to the archive as it is synthesised, so no
+    intermediate WAV files are written. WAV data does not compress well, so it is
+    stored uncompressed.
+
+    Args:
+        provider (Provider): TTS provider to synthesise with.
+        model (VoiceModel): Voice model to synthesise with.
+        sound_files (list): SoundFile objects to synthesise.
+        zip_path (Path): Path of the zip archive to create.
+
+    Returns:
+        list: SoundFile objects which failed to be synthesised.
+    """
+    lock = threading.Lock()
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as archive:
+
+        def task(sound_file: SoundFile) -> None:
+            data = provider.synthesise(sound_file.text, model).to_wav_bytes()
+            with lock:
+                archive.writestr(f"{sound_file.path}.wav", data)
+
+        return process_queue(task, sound_files, workers=provider.concurrency(model))
+
+
+@click.command()
+@click.argument("filepath", type=click.Path(exists=True, dir_okay=False))
+@click.option("-o", "--output", default=".", help="Output directory.")
+@click.option(
+    "-d",
+    "--dry-run",
+    show_default=True,
+    is_flag=True,
+    help="Perform a dry run without actual processing.",
+)
+@click.option(
+    "-z",
+    "--zip",
+    "compress",
+    show_default=True,
+    is_flag=True,
+    help="Output voicepack as a zip file.",
+)
+def build(filepath: str, output: str, dry_run: bool, compress: bool) -> None:
+    """Build an installable voice pack from a config file.
+
+    Filepath: Can be a file containing YAML, JSON, or CSV data.
+    """
+    voicepack = load_voicepack(filepath)
+    model = voicepack.model
+    if model is None:
+        msg = f"Voicepack '{voicepack.name}' does not define a voice model."
+        raise click.ClickException(msg)
+
+    sound_files = voicepack.worklist()
+    click.echo(
+        f"Building voicepack '{voicepack.name}' using {model.provider.provider}, "
+        f"{len(sound_files)} sounds."
+    )
+    if dry_run:
+        for sound_file in sound_files:
+            click.echo(f"{sound_file.path}.wav: {sound_file.text}")
+        return
+
+    provider = model.provider()
+    output_dir = Path(output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if compress:
+        destination = output_dir / f"{voicepack.packname}.zip"
+        failed = write_zip(provider, model, sound_files, destination)
+    else:
+        destination = output_dir / voicepack.packname
+        failed = provider.process_many(sound_files, model, destination)
+
+    if failed:
+        msg = f"Failed to build {len(failed)} of {len(sound_files)} sounds."
+        raise click.ClickException(msg)
+    click.echo("Completed building voicepack.")
+    click.echo(f"{voicepack.packname}: {destination}")
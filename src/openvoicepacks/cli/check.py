@@ -0,0 +1,15 @@
+"""Check command for the OpenVoicePacks CLI."""
+
+import click
+
+
+@click.command()
+def check() -> None:
+    """Check the validity of a voice pack file.
+
+    This command verifies that the specified voice pack file is valid.
+    It checks for correct structure, required fields, and proper formatting.
+
+    Filetypes supported: YAML, JSON, CSV.
+    """
+    raise NotImplementedError("Check command not yet implemented.")
@@ -0,0 +1,49 @@
+"""Init command for the OpenVoicePacks CLI."""
+
+import click
+
+from openvoicepacks.client import LazyChoice
+from openvoicepacks.plugin_registry import provider_names
+from openvoicepacks.voicemodel import VoiceModel
+from openvoicepacks.voicepack import VoicePack
+
+
+def provider_choices() -> list[str]:
+    """Return the names of the TTS providers which can be chosen."""
+    return ["generic", *provider_names()]
+
+
+@click.command()
+@click.option(
+    "-n",
+    "--name",
+    prompt="Enter the name of the new voice pack",
+    help="Name of the voice pack you are creating.",
+)
+@click.option(
+    "-p",
+    "--provider",
+    prompt="TTS provider to use",
+    type=LazyChoice(provider_choices, case_sensitive=False),
+    default="generic",
+    help="TTS provider for the voice pack.",
+)
+@click.option(
+    "-o",
+    "--packname",
+    help="Filename for the voice pack (optional).",
+)
+def init(name: str, provider: str, packname: str) -> None:
+    """Create a new voicepack config file.
+
+    Create a new voicepack config file, allowing you to specify the sounds you want to
+    include as well as the TTS provider and voice model to use, and some additional
+    metadata.
+
+    When options are not provided, you will be prompted to enter them interactively.
+    """
+    click.echo(f"Creating new voicepack '{name}' with provider '{provider}'...")
+    model = VoiceModel(provider=provider, voice="default")
+    voicepack = VoicePack(name=name, model=model, packname=(packname or name))
+    file = voicepack.save()
+    click.echo(f"Voicepack '{name}' created successfully at '{file}'.")
@@ -0,0 +1,9 @@
+"""Merge command for the OpenVoicePacks CLI."""
+
+import click
+
+
+@click.command()
+def merge() -> None:
+    """Merge together multiple voicepacks."""
+    raise NotImplementedError("Merge command not yet implemented.")
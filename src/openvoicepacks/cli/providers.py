@@ -0,0 +1,23 @@
+"""Providers command for the OpenVoicePacks CLI."""
+
+import click
+
+from openvoicepacks.plugin_registry import get_providers
+
+
+@click.command()
+def providers() -> None:
+    """List registered providers."""
+    ovp_providers = get_providers()
+    if not ovp_providers:
+        click.echo("No TTS providers registered.")
+        return
+    click.echo("Registered TTS providers:")
+    for provider in ovp_providers.values():
+        msg = "".join(
+            (
+                f"- {provider.__name__} ",
+                f"({provider.provider} {provider.version}): {provider.description}",
+            )
+        )
+        click.echo(msg)
@@ -0,0 +1,15 @@
+"""Version command for the OpenVoicePacks CLI."""
+
+import click
+
+from openvoicepacks.utils import metadata
+
+
+@click.command()
+@click.option(
+    "-s", "--short", default=False, is_flag=True, help="Display short version."
+)
+def version(short: bool) -> None:
+    """Display the OpenVoicePacks version."""
+    msg = metadata["version"] if short else f"{metadata['name']} {metadata['version']}"
+    click.echo(msg)
@@ -1,46 +1,93 @@
-"""Module for CLI interface."""
+"""Module for CLI interface.
+
+Subcommands live in the openvoicepacks.cli package and are loaded lazily, so commands
+such as `ovp version` do not pay the cost of importing TTS providers.
+"""
+
+import importlib
+from collections.abc import Callable, Iterable
 
 import click
 
-from openvoicepacks.plugin_registry import providers as ovp_providers
-from openvoicepacks.utils import metadata
-from openvoicepacks.voicemodel import VoiceModel
-from openvoicepacks.voicepack import VoicePack
+from openvoicepacks.utils import configure_logging
 
 
-@click.group()
-def ovp() -> None:
-    """OpenVoicePacks command line interface.
+class LazyGroup(click.Group):
+    """Click group which only imports subcommands when they are needed.
 
-    Generate and customize complete voice packs for OpenTX and EdgeTX radios.
+    Args:
+        lazy_subcommands (dict): Mapping of command name to a (module, attribute) tuple
+            locating the click command to load.
     """
 
+    def __init__(
+        self,
+        *args: object,
+        lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+        **kwargs: object,
+    ) -> None:
+        """Initialise the group with an optional set of lazily loaded subcommands."""
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return the names of all eager and lazy subcommands."""
+        return sorted(super().list_commands(ctx) + list(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the named subcommand, importing it first if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        """Import and return a lazy subcommand.
+
+        Raises:
+            TypeError: If the import path does not point to a click command.
+        """
+        module_name, attr_name = self.lazy_subcommands[cmd_name]
+        module = importlib.import_module(module_name)
+        command = getattr(module, attr_name)
+        if not isinstance(command, click.Command):
+            msg = f"Lazy subcommand '{cmd_name}' is not a click command: {command!r}"
+            raise TypeError(msg)
+        return command
+
+
+class LazyChoice(click.Choice):
+    """Click choice whose choices are only computed when they are first needed.
+
+    Useful when finding the choices is expensive, such as scanning installed plugins,
+    and should not happen just because the command module was imported.
+
+    Args:
+        choices_factory (Callable): Function returning the valid choices.
+        case_sensitive (bool, optional): Whether choices are case sensitive.
+            Defaults to True.
+    """
 
-@click.command()
-@click.option(
-    "-s", "--short", default=False, is_flag=True, help="Display short version."
-)
-def version(short: bool) -> None:
-    """Display the OpenVoicePacks version."""
-    msg = metadata["version"] if short else f"{metadata['name']} {metadata['version']}"
-    click.echo(msg)
-
-
-@click.command()
-def providers() -> None:
-    """List registered providers."""
-    if not ovp_providers:
-        click.echo("No TTS providers registered.")
-        return
-    click.echo("Registered TTS providers:")
-    for provider in ovp_providers.values():
-        msg = "".join(
-            (
-                f"- {provider.__name__} ",
-                f"({provider.provider} {provider.version}): {provider.description}",
-            )
-        )
-        click.echo(msg)
+    def __init__(
+        self,
+        choices_factory: Callable[[], Iterable[str]],
+        case_sensitive: bool = True,  # NOQA: FBT001, FBT002
+    ) -> None:
+        """Initialise the choice with a factory for its choices."""
+        super().__init__((), case_sensitive=case_sensitive)
+        self._choices_factory = choices_factory
+        # Choice stores the empty choices given above, forget them until needed.
+        self._choices: tuple[str, ...] | None = None
+
+    @property
+    def choices(self) -> tuple[str, ...]:
+        """Return the valid choices, calling the factory on first access."""
+        if self._choices is None:
+            self._choices = tuple(self._choices_factory())
+        return self._choices
+
+    @choices.setter
+    def choices(self, value: Iterable[str]) -> None:
+        self._choices = tuple(value)
 
 
 _CLI = {
@@ -51,92 +98,21 @@ _CLI = {
     }
 }
 
-provider_choices = ["generic"]
-provider_choices.extend(p.provider for p in ovp_providers.values())
 
-
-@click.command()
-def merge() -> None:
-    """Merge together multiple voicepacks."""
-    raise NotImplementedError("Merge command not yet implemented.")
-
-
-@click.command()
-@click.option(
-    "-n",
-    "--name",
-    prompt="Enter the name of the new voice pack",
-    help="Name of the voice pack you are creating.",
-)
-@click.option(
-    "-p",
-    "--provider",
-    prompt="TTS provider to use",
-    type=click.Choice(provider_choices, case_sensitive=False),
-    default=provider_choices[0],
-    help="TTS provider for the voice pack.",
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "build": ("openvoicepacks.cli.build", "build"),
+        "check": ("openvoicepacks.cli.check", "check"),
+        "init": ("openvoicepacks.cli.init", "init"),
+        "merge": ("openvoicepacks.cli.merge", "merge"),
+        "providers": ("openvoicepacks.cli.providers", "providers"),
+        "version": ("openvoicepacks.cli.version", "version"),
+    },
 )
-@click.option(
-    "-o",
-    "--packname",
-    help="Filename for the voice pack (optional).",
-)
-def init(name: str, provider: str, packname: str) -> None:
-    """Create a new voicepack config file.
-
-    Create a new voicepack config file, allowing you to specify the sounds you want to
-    include as well as the TTS provider and voice model to use, and some additional
-    metadata.
-
-    When options are not provided, you will be prompted to enter them interactively.
-    """
-    click.echo(f"Creating new voicepack '{name}' with provider '{provider}'...")
-    model = VoiceModel(provider=provider, voice="default")
-    voicepack = VoicePack(name=name, model=model, packname=(packname or name))
-    file = voicepack.save()
-    click.echo(f"Voicepack '{name}' created successfully at '{file}'.")
-
-
-@click.command()
-def check() -> None:
-    """Check the validity of a voice pack file.
-
-    This command verifies that the specified voice pack file is valid.
-    It checks for correct structure, required fields, and proper formatting.
-
-    Filetypes supported: YAML, JSON, CSV.
-    """
-    raise NotImplementedError("Check command not yet implemented.")
-
-
-@click.command()
-@click.argument("filepath", type=click.Path(exists=True))
-@click.option("-o", "--output", default=".", help="Output directory.")
-@click.option(
-    "-d",
-    "--dry-run",
-    show_default=True,
-    is_flag=True,
-    help="Perform a dry run without actual processing.",
-)
-@click.option(
-    "-z",
-    "--zip",
-    show_default=True,
-    is_flag=True,
-    help="Output voicepack as a zip file.",
-)
-def build(filepath: click.Path, output: str, dry_run: bool, compress: bool) -> None:
-    """Build an installable voice pack from a config file.
+def ovp() -> None:
+    """OpenVoicePacks command line interface.
 
-    Filepath: Can be a file containing YAML, JSON, or CSV data.
+    Generate and customize complete voice packs for OpenTX and EdgeTX radios.
     """
-    click.echo(filepath)
-
-
-ovp.add_command(version)
-ovp.add_command(providers)
-ovp.add_command(init)
-ovp.add_command(merge)
-ovp.add_command(check)
-ovp.add_command(build)
+    configure_logging()
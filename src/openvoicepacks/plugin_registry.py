@@ -2,60 +2,122 @@
 
 This module handles the discovery and registration of plugins.
 
+Plugins are advertised through the "openvoicepacks.providers" entry point group, with
+the entry point name matching the provider name. For example, in pyproject.toml:
+
+    [project.entry-points."openvoicepacks.providers"]
+    piper = "openvoicepacks.plugins.piper"
+
 Each plugin can register one or more TTS providers by defining a PROVIDER attribute
 pointing to a subclass of the Provider base class.
 
+Provider names are read from the entry point metadata without importing anything, and
+a plugin is only imported when its provider is first requested, as importing plugins
+pulls in heavy dependencies such as boto3.
+
 Attributes:
     providers (dict): A registry of available TTS providers.
 """
 
 # https://packaging.python.org/en/latest/guides/creating-and-discovering-plugins/
 
-import importlib
-import pkgutil
+import threading
+from functools import cache
+from importlib.metadata import EntryPoint, entry_points
+from types import ModuleType
 
-import openvoicepacks.plugins
 from openvoicepacks.providers import Provider
 
-# Registry of providers, keyed by provider name. Import this to access provider list.
-providers = {}
+ENTRY_POINT_GROUP = "openvoicepacks.providers"
 
+# Registry of loaded providers, keyed by provider name. Use get_providers() to access.
+_providers: dict[str, type[Provider]] = {}
+_lock = threading.Lock()
 
-def discover_plugins() -> None:
-    """Discover and load all plugins in the openvoicepacks.plugins package."""
-    plugins = []
-    for _, name, _ in pkgutil.iter_modules(openvoicepacks.plugins.__path__):
-        module = importlib.import_module(f"openvoicepacks.plugins.{name}")
-        plugins.append(module)
-    return plugins
 
+@cache
+def discover_plugins() -> dict[str, EntryPoint]:
+    """Discover installed plugins without importing them.
+
+    Returns:
+        dict: Plugin entry points, keyed by provider name.
+    """
+    return {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
 
-def register_providers() -> None:
-    """Register providers from discovered plugins.
+
+def provider_names() -> list[str]:
+    """Return the names of all installed providers, without importing them."""
+    return sorted(discover_plugins())
+
+
+def register_providers(plugins: list[ModuleType]) -> None:
+    """Register providers from loaded plugins.
 
     If plugins contain a PROVIDER attribute, it is registered here.
+
+    Args:
+        plugins (list): Plugin modules to register providers from.
+    """
+    for plugin in plugins:
+        provider_class = getattr(plugin, "PROVIDER", None)
+        if provider_class is not None:
+            _providers[provider_class.provider] = provider_class
+
+
+def load_provider(name: str) -> type[Provider]:
+    """Import the plugin for the named provider and return its provider class.
+
+    Args:
+        name (str): Name of the TTS provider, as given by its entry point.
+
+    Raises:
+        ValueError: If the plugin has no PROVIDER, or it is registered under a
+            different name to its entry point.
     """
-    for plugin in all_plugins:
-        if hasattr(plugin, "PROVIDER"):
-            provider_class = getattr(plugin, "PROVIDER")  # NOQA: B009
-            providers[provider_class.provider] = provider_class
+    with _lock:
+        if name not in _providers:
+            plugin = discover_plugins()[name].load()
+            provider_class = getattr(plugin, "PROVIDER", None)
+            if provider_class is None:
+                msg = f'Plugin "{plugin.__name__}" has no PROVIDER attribute'
+                raise ValueError(msg)
+            if provider_class.provider != name:
+                msg = (
+                    f'Plugin "{plugin.__name__}" provides "{provider_class.provider}",'
+                    f' but its entry point is named "{name}"'
+                )
+                raise ValueError(msg)
+            register_providers([plugin])
+    return _providers[name]
+
+
+def get_providers() -> dict[str, type[Provider]]:
+    """Return the registry of providers, loading every installed plugin."""
+    for name in discover_plugins():
+        load_provider(name)
+    return _providers
 
 
 def get_provider_class(provider: str) -> type[Provider]:
     """Return the provider class for the given provider name.
 
+    Only the plugin for the requested provider is imported.
+
     Args:
         provider (str): Name of the TTS provider.
     """
-    if provider.lower() in providers:
-        return providers[provider.lower()]
+    if provider.lower() in discover_plugins():
+        return load_provider(provider.lower())
     if provider == "generic":
         return Provider
 
-    msg = f"Unknown provider: {provider}, should be one of {list(providers.keys())}"
+    msg = f"Unknown provider: {provider}, should be one of {provider_names()}"
     raise ValueError(msg)
 
 
-# Auto-register plugins and providers
-all_plugins = discover_plugins()
-register_providers()
+def __getattr__(name: str) -> object:
+    """Lazily expose the provider registry as the providers module attribute."""
+    if name == "providers":
+        return get_providers()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,6 +1,11 @@
 """Piper TTS provider plugin for OpenVoicePacks."""
 
+import json
 import logging
+import os
+import threading
+import time
+from functools import cache
 from pathlib import Path
 from typing import ClassVar
 
@@ -9,10 +14,41 @@ import piper.download_voices
 
 from openvoicepacks.audio import AudioData
 from openvoicepacks.providers import Provider, VoiceModelProtocol
-from openvoicepacks.utils import json_from_url, metadata
+from openvoicepacks.utils import cache_dir, json_from_url, metadata
 
 _logger = logging.getLogger(__name__)
 
+# How long a downloaded copy of the Piper voices index is used for, in seconds.
+VOICES_TTL = 24 * 60 * 60
+
+
+@cache
+def voices_index() -> dict:
+    """Return the index of voice models available for download.
+
+    The index is fetched at most once per process, and a copy is kept in the user
+    cache directory to be reused by later processes for up to VOICES_TTL seconds.
+
+    Returns:
+        dict: Voice model details, keyed by model name.
+    """
+    cache_file = cache_dir("piper", "voices.json")
+    try:
+        if time.time() - cache_file.stat().st_mtime < VOICES_TTL:
+            return json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache, so fetch a fresh copy.
+
+    voices = json_from_url(piper.download_voices.VOICES_JSON)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(voices), encoding="utf-8")
+        tmp_file.replace(cache_file)
+    except OSError:
+        _logger.debug('Unable to cache the voices index at "%s".', cache_file)
+    return voices
+
 
 class Piper(Provider):
     """Piper text-to-speech service client.
@@ -22,6 +58,9 @@ class Piper(Provider):
     Attributes:
         install_dir (str): Directory where Piper voice models are installed.
             Defaults to '.cache/piper'.
+        use_cuda (bool): Run inference on a CUDA GPU instead of the CPU.
+        quantize (bool): Run an int8-quantised copy of each voice model, which is
+            faster on CPU with a small loss in quality. Requires the onnx package.
     """
 
     description: ClassVar[str] = "Piper TTS provider using local ONNX models."
@@ -33,6 +72,26 @@ class Piper(Provider):
 
     install_dir: str = ".cache/piper"
 
+    def __init__(self, *, use_cuda: bool = False, quantize: bool = False) -> None:
+        """Initialise the Piper TTS provider.
+
+        Args:
+            use_cuda (bool, optional): Run inference on a CUDA GPU. Defaults to False.
+            quantize (bool, optional): Run int8-quantised voice models.
+                Defaults to False.
+        """
+        self.use_cuda = use_cuda
+        self.quantize = quantize
+
+        # Loaded voices, keyed by model path. Loading parses the ONNX model and
+        # creates an inference session, so it is only done once per model.
+        self._voices: dict[Path, piper.PiperVoice] = {}
+        self._voices_lock = threading.Lock()
+        # One lock per model, held whilst it is downloaded and loaded, so that
+        # concurrent requests never write or read a partially downloaded model.
+        # Reentrant, as load_voice() takes it again when called by _synthesise().
+        self._model_locks: dict[Path, threading.RLock] = {}
+
     # TODO: Validate that install_dir base dir exists and is writable.
 
     # TODO: Add in more filtering options.
@@ -93,28 +152,103 @@ class Piper(Provider):
         # Download the voice model if not already available
         # TODO: Consider moving model_path to a method.
         model_path = Path(f"{self.install_dir}/{model_name}.onnx")
-        if not model_path.exists():
-            _logger.info("Voice model not found, downloading...")
-            self.download_voice(model_name)
-
-        # Perform synthesis
-        piper_voice: piper.PiperVoice = piper.PiperVoice.load(model_path)
-        response: piper.SynthesisResult = next(
-            piper_voice.synthesize(
-                text,
-                piper.SynthesisConfig(
-                    volume=1.0,
-                    length_scale=1.0,
-                    noise_scale=1.0,
-                    noise_w_scale=1.0,
-                    normalize_audio=False,
-                ),
+        with self._model_lock(model_path):
+            if not model_path.exists():
+                _logger.info("Voice model not found, downloading...")
+                self.download_voice(model_name)
+            piper_voice = self.load_voice(model_path)
+
+        # Perform synthesis, Piper yields one audio chunk per sentence
+        chunks = piper_voice.synthesize(
+            text,
+            piper.SynthesisConfig(
+                volume=1.0,
+                length_scale=1.0,
+                noise_scale=1.0,
+                noise_w_scale=1.0,
+                normalize_audio=False,
             ),
         )
+        # View each chunk's int16 samples as bytes without copying them. Only audio
+        # made of several chunks (sentences) is copied, to join it together. Text
+        # with nothing to speak yields no chunks, which gives empty audio.
+        views = [memoryview(chunk.audio_int16_array).cast("B") for chunk in chunks]
+        if not views:
+            audio = b""
+        elif len(views) == 1:
+            audio = views[0]
+        else:
+            audio = b"".join(views)
 
         # Return the audio data as a AudioData object (16-bit PCM)
         _logger.info('Successfully completed synthesis of "%s".', text)
-        return AudioData(data=response.audio_int16_bytes, rate=response.sample_rate)
+        return AudioData(data=audio, rate=piper_voice.config.sample_rate)
+
+    def _model_lock(self, model_path: Path) -> threading.RLock:
+        """Return the lock guarding the download and loading of a model.
+
+        Args:
+            model_path (Path): Path to the ONNX voice model.
+
+        Returns:
+            threading.RLock: The lock for the model, shared by later calls.
+        """
+        with self._voices_lock:
+            return self._model_locks.setdefault(model_path, threading.RLock())
+
+    def load_voice(self, model_path: Path) -> piper.PiperVoice:
+        """Return the Piper voice for a model, loading it on first use.
+
+        Args:
+            model_path (Path): Path to the ONNX voice model.
+
+        Returns:
+            piper.PiperVoice: The loaded voice, shared by later calls.
+        """
+        with self._voices_lock:
+            voice = self._voices.get(model_path)
+        if voice is not None:
+            return voice
+
+        # Loading, and quantising, can take seconds, so only requests for this model
+        # wait on it. The instance-wide lock is held just to look up and add voices.
+        with self._model_lock(model_path):
+            with self._voices_lock:
+                voice = self._voices.get(model_path)
+            if voice is None:
+                _logger.debug('Loading voice model "%s".', model_path)
+                onnx_path = self.quantized_model(model_path) if self.quantize else None
+                voice = piper.PiperVoice.load(
+                    onnx_path or model_path,
+                    config_path=f"{model_path}.json",
+                    use_cuda=self.use_cuda,
+                )
+                with self._voices_lock:
+                    self._voices[model_path] = voice
+            return voice
+
+    def quantized_model(self, model_path: Path) -> Path:
+        """Return the path to an int8-quantised copy of a voice model.
+
+        The quantised model is created next to the original on first use.
+
+        Args:
+            model_path (Path): Path to the ONNX voice model.
+
+        Returns:
+            Path: Path to the quantised ONNX voice model.
+        """
+        quantized_path = model_path.with_suffix(".int8.onnx")
+        if not quantized_path.exists():
+            # Quantisation needs the optional onnx package
+            from onnxruntime.quantization import (  # NOQA: PLC0415
+                QuantType,
+                quantize_dynamic,
+            )
+
+            _logger.info('Quantising voice model "%s".', model_path)
+            quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+        return quantized_path
 
     def download_voice(self, model_name: str) -> None:
         """Download a voice model for Piper TTS.
@@ -125,8 +259,7 @@ class Piper(Provider):
         _logger.debug('Ensuring voice model "%s" is available.', model_name)
 
         # Check if the model is available for download
-        voices_dict = json_from_url(piper.download_voices.VOICES_JSON)
-        if model_name not in sorted(voices_dict.keys()):
+        if model_name not in voices_index():
             msg = f'Voice model "{model_name}" is not available.'
             _logger.error(msg)
             raise ValueError(msg)
@@ -1,25 +1,95 @@
 """AWS Polly TTS provider plugin for OpenVoicePacks."""
 
+import hashlib
+import json
 import logging
-from typing import ClassVar
-
-import boto3
+import os
+import re
+import threading
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
 
 from openvoicepacks.audio import AudioData
 from openvoicepacks.providers import Provider, VoiceModelProtocol
+from openvoicepacks.utils import cache_dir as user_cache_dir
 from openvoicepacks.utils import metadata
 
+# boto3 loads its service models on import, so it is only imported once a provider is
+# created. This keeps test collection and CLI commands which never call AWS fast.
+if TYPE_CHECKING:
+    import boto3
+
 _logger = logging.getLogger(__name__)
 
 
+# Matches SSML tags, to tell marked up text from plain text.
+_SSML_TAG_RE = re.compile(r"<[a-zA-Z/][^>]*>")
+_SSML_OPEN = "<speak>"
+_SSML_CLOSE = "</speak>"
+_SSML_BREAK_CLOSE = '<break strength="weak"/></speak>'
+
+
+def _ssml(text: str, add_break: bool) -> tuple[str, str]:  # NOQA: FBT001
+    """Return the Polly text type and text to send for a phrase.
+
+    Text already wrapped in a <speak> element is sent as is. Otherwise text is wrapped
+    in <speak> if it has SSML tags or a trailing break is wanted, and plain text is
+    sent as text, saving Polly parsing it as SSML.
+
+    Args:
+        text (str): The phrase to be synthesised, optionally marked up with SSML.
+        add_break (bool): Add a short pause to the end of the phrase.
+
+    Returns:
+        tuple: Polly TextType ("ssml" or "text") and the text to send.
+    """
+    if text.lstrip().startswith("<speak"):
+        return "ssml", text
+    if add_break:
+        return "ssml", _SSML_OPEN + text + _SSML_BREAK_CLOSE
+    if _SSML_TAG_RE.search(text):
+        return "ssml", _SSML_OPEN + text + _SSML_CLOSE
+    return "text", text
+
+
+@cache
+def _polly_voice(voice: str, language: str) -> tuple[str, str]:
+    """Return the Polly voice ID and language code for a voice model.
+
+    These are the same for every phrase synthesised with a model, so are only
+    formatted once. The strings hash quickly as Python caches their hashes.
+
+    Args:
+        voice (str): Voice name, as stored in the voice model.
+        language (str): Language code, such as 'en_GB'.
+
+    Returns:
+        tuple: Voice ID and language code in the form Polly expects.
+    """
+    return voice.capitalize(), language.replace("_", "-")  # Polly expects hyphens
+
+
 class Polly(Provider):
     """AWS Polly text-to-speech service client.
 
     Provides speech synthesis using AWS Polly cloud service.
 
+    Synthesised audio is cached on disk, keyed by the request parameters, so phrases
+    are only sent to AWS (and billed) once.
+
+    Audio is requested as 16 kHz PCM by default. Set "output_format" in the voice
+    model extras to "mp3" or "ogg_vorbis" to transfer compressed audio instead, which
+    is decoded with ffmpeg when written.
+
+    Phrases end with a short SSML break by default. Set "add_break" to false in the
+    voice model extras to send plain text phrases as plain text.
+
     Attributes:
         session (boto3.session.Session, optional):
             A boto3 session object. If not provided, a default session is created.
+        cache_dir (Path): Directory where synthesised audio is cached.
+        cache_size (int): Maximum size of the audio cache in bytes.
     """
 
     description: ClassVar[str] = "AWS Polly TTS provider using cloud service."
@@ -33,27 +103,94 @@ class Polly(Provider):
         "long-form",
         "generative",
     }
+    # Maximum number of requests in flight at once, within Polly's TPS quotas.
+    max_concurrency: ClassVar[int] = 32
+    engine_concurrency: ClassVar[dict[str, int]] = {"generative": 8, "long-form": 8}
 
-    session: boto3.session.Session
+    session: "boto3.session.Session"
+    cache_dir: Path
+    cache_size: int
 
-    def __init__(self, session: boto3.session.Session = None) -> None:
+    def __init__(  # NOQA: PLR0913
+        self,
+        session: "boto3.session.Session" = None,
+        *,
+        cache_dir: str | Path | None = None,
+        cache_size: int = 512 * 1024**2,
+        connect_timeout: float = 5,
+        read_timeout: float = 15,
+        max_pool_connections: int | None = None,
+        verify_on_init: bool = False,
+    ) -> None:
         """Initialise the Polly TTS provider.
 
         Args:
             session (boto3.session.Session, optional):
                 A boto3 session object. If not provided, a default session is created.
+            cache_dir (str | Path, optional): Directory to cache synthesised audio in.
+                Defaults to "polly" within the OpenVoicePacks user cache directory.
+            cache_size (int, optional): Maximum size of the audio cache in bytes, the
+                least recently used audio is removed beyond this. Defaults to 512 MB.
+            connect_timeout (float, optional): Seconds to wait for a connection to AWS.
+                Defaults to 5.
+            read_timeout (float, optional): Seconds to wait for a response from AWS.
+                Defaults to 15.
+            max_pool_connections (int, optional): Maximum number of connections kept
+                open to AWS. Defaults to max_concurrency.
+            verify_on_init (bool, optional): Check the AWS credentials immediately,
+                rather than before the first request to Polly. Defaults to False.
         """
+        self.cache_dir = Path(cache_dir) if cache_dir else user_cache_dir("polly")
+        self.cache_size = cache_size
+        self.prune_cache()
+
         # Use existing session if one is provided, or create a new one
         if session:
             self.session = session
         else:
+            import boto3  # NOQA: PLC0415
+
             self.session = boto3.session.Session()
 
-        # Authenticate to AWS
-        sts = self.session.client("sts")
-        caller = sts.get_caller_identity()
-        _logger.info("Authenticated to AWS as '%s'.", caller["Arn"])
-        self._client = self.session.client("polly")
+        # Size the connection pool so concurrent requests reuse TLS connections, keep
+        # them alive while idle, and fail fast on stalled connections. Adaptive
+        # retries back off and rate limit the client when Polly throttles requests.
+        from botocore.config import Config  # NOQA: PLC0415
+
+        self._config = Config(
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_pool_connections=max_pool_connections or self.max_concurrency,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+            tcp_keepalive=True,
+        )
+
+        self._client = self.session.client("polly", config=self._config)
+
+        # Credentials are checked once, when first needed, as it is a round trip
+        self._identity: str | None = None
+        self._identity_lock = threading.Lock()
+        if verify_on_init:
+            self.verify_identity()
+
+    def verify_identity(self) -> str:
+        """Authenticate to AWS, checking the session credentials.
+
+        The check is only made once per instance, later calls return the same result.
+
+        Returns:
+            str: ARN of the authenticated AWS identity.
+
+        Raises:
+            botocore.exceptions.BotoCoreError: If no credentials are available.
+            botocore.exceptions.ClientError: If the credentials are invalid.
+        """
+        with self._identity_lock:
+            if self._identity is None:
+                sts = self.session.client("sts", config=self._config)
+                self._identity = sts.get_caller_identity()["Arn"]
+                _logger.info("Authenticated to AWS as '%s'.", self._identity)
+            return self._identity
 
     def _synthesise(self, text: str, model: VoiceModelProtocol) -> AudioData:
         """Synthesise speech data using AWS Polly.
@@ -65,28 +202,107 @@ class Polly(Provider):
         Returns:
             AudioData: AudioData object containing the audio byte data and sample rate.
         """
-        # FIXME: SSML may not work with all voice engines. This may need to be moved to
-        # the VoiceModel object so users can provide their own SSML when needed.
+        # FIXME: SSML may not work with all voice engines.
         # NOTE: Now that we have the capabilities field, we can check if the voice
         # supports SSML.
-        # Regex to check string: (</*[a-z =_0-9"]+/*>)
-        ssml = f'<speak>{text}<break strength="weak"/></speak>'
+        text_type, text_data = _ssml(text, (model.extras or {}).get("add_break", True))
         sample_rate = 16000
-        language = model.language.replace("_", "-")  # Polly expects hyphens
+        voice_id, language = _polly_voice(model.voice, model.language)
+        # Compressed formats transfer less data, but need ffmpeg to decode them.
+        output_format = (model.extras or {}).get("output_format", "pcm")
+
+        params = {
+            "Text": text_data,
+            "VoiceId": voice_id,
+            "LanguageCode": language,
+            "Engine": model.option,
+            "TextType": text_type,
+            "OutputFormat": output_format,
+            "SampleRate": str(sample_rate),
+        }
+        key = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+        audio = self._read_cache(key)
+        if audio is not None:
+            _logger.info('Using cached synthesis of "%s".', text)
+            return audio
 
         # Perform synthesis
-        response: dict = self._client.synthesize_speech(
-            Text=ssml,
-            VoiceId=model.voice.capitalize(),
-            LanguageCode=language,
-            Engine=model.option,
-            TextType="ssml",
-            OutputFormat="pcm",
-        )
+        self.verify_identity()
+        response: dict = self._client.synthesize_speech(**params)
 
-        # Return the audio data as a AudioData object (16-bit PCM)
+        # Return the audio data as a AudioData object (16-bit PCM, unless compressed)
         _logger.info('Successfully completed synthesis of "%s".', text)
-        return AudioData(data=response["AudioStream"].read(), rate=sample_rate)
+        audio = AudioData(
+            data=response["AudioStream"].read(),
+            rate=sample_rate,
+            format=output_format,
+        )
+        self._write_cache(key, audio)
+        return audio
+
+    def _read_cache(self, key: str) -> AudioData | None:
+        """Return cached audio for a request key, or None if it is not cached."""
+        audio_file = self.cache_dir / f"{key}.audio"
+        try:
+            info = json.loads(audio_file.with_suffix(".json").read_bytes())
+            audio = AudioData(
+                data=audio_file.read_bytes(), rate=info["rate"], format=info["format"]
+            )
+            os.utime(audio_file)  # Mark as recently used for pruning.
+        except (OSError, ValueError, KeyError):
+            return None
+        return audio
+
+    def _write_cache(self, key: str, audio: AudioData) -> None:
+        """Atomically write audio to the cache under a request key."""
+        audio_file = self.cache_dir / f"{key}.audio"
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # The audio is written last, as its presence marks a complete entry.
+            info = json.dumps({"rate": audio.rate, "format": audio.format})
+            for path, data in (
+                (audio_file.with_suffix(".json"), info),
+                (audio_file, audio.data),
+            ):
+                tmp_file = path.with_name(path.name + suffix)
+                with tmp_file.open("w" if isinstance(data, str) else "wb") as f:
+                    f.write(data)
+                tmp_file.replace(path)
+        except OSError:
+            _logger.debug('Unable to cache audio at "%s".', audio_file)
+
+    def prune_cache(self) -> None:
+        """Remove the least recently used audio until the cache fits cache_size."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".audio"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        except OSError:
+            return  # No cache yet.
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.cache_size:
+                break
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+
+    def concurrency(self, model: VoiceModelProtocol) -> int:
+        """Return the maximum number of synthesis requests to run at once.
+
+        Synthesis is network-bound, so requests run concurrently sharing the client's
+        connection pool, within the transaction quota for the model's engine.
+
+        Args:
+            model (VoiceModel): VoiceModel object representing the voice model to use.
+        """
+        return self.engine_concurrency.get(model.option, self.max_concurrency)
 
 
 PROVIDER = Polly
@@ -5,9 +5,12 @@ All providers should inherit from this class and implement the synthesise method
 
 """
 
+import asyncio
+from pathlib import Path
 from typing import ClassVar, Protocol
 
-from openvoicepacks.audio import AudioData
+from openvoicepacks.audio import AudioData, SoundFile
+from openvoicepacks.worker import default_workers, process_queue
 
 
 class VoiceModelProtocol(Protocol):
@@ -94,6 +97,21 @@ class Provider:
         # Synthesise and return audio data.
         return self._synthesise(text, model)
 
+    async def async_synthesise(self, text: str, model: VoiceModelProtocol) -> AudioData:
+        """Synthesise speech from text without blocking the event loop.
+
+        By default synthesise() is run in a worker thread. Providers with a native
+        asynchronous client can override this.
+
+        Args:
+            text (str): The text phrase to be synthesised.
+            model (VoiceModel): VoiceModel object representing the voice model to use.
+
+        Returns:
+            AudioData: AudioData object containing the audio byte data and sample rate.
+        """
+        return await asyncio.to_thread(self.synthesise, text, model)
+
     def _synthesise(self, text: str, model: VoiceModelProtocol) -> AudioData:
         """Stub method for synthesising speech from text using a VoiceModel object.
 
@@ -101,13 +119,58 @@ class Provider:
         """
         raise NotImplementedError("Subclasses must implement this method")
 
-    def process(self, path: str, *args: object, **kwargs: object) -> None:
+    def concurrency(self, model: VoiceModelProtocol) -> int:  # NOQA: ARG002
+        """Return the maximum number of synthesis requests to run at once.
+
+        Providers with service quotas should override this to stay within them.
+
+        Args:
+            model (VoiceModel): VoiceModel object representing the voice model to use.
+        """
+        return default_workers()
+
+    def process(self, path: str | Path, *args: object, **kwargs: object) -> None:
         """Synthesise audio from text and write to the given file path.
 
         Args:
-            path (str): The file path to write the output audio data to.
+            path (str | Path): The file path to write the output audio data to.
             *args: Additional positional arguments for synthesise().
             **kwargs: Additional keyword arguments for synthesise().
         """
         audio_data: AudioData = self.synthesise(*args, **kwargs)
         audio_data.write_wav(path)
+
+    def process_many(
+        self,
+        sound_files: list[SoundFile],
+        model: VoiceModelProtocol,
+        directory: str | Path,
+        max_workers: int | None = None,
+    ) -> list[SoundFile]:
+        """Synthesise a list of sound files in parallel and write them as WAV files.
+
+        Each sound file is written to "<directory>/<path>.wav", creating any missing
+        subdirectories. Providers are expected to be safe to call from several
+        threads at once.
+
+        Args:
+            sound_files (list): SoundFile objects to synthesise.
+            model (VoiceModel): VoiceModel object representing the voice model to use.
+            directory (str | Path): Directory to write the output audio files to.
+            max_workers (int, optional): Maximum number of worker threads.
+                Defaults to, and is limited to, concurrency() for the model.
+
+        Returns:
+            list: SoundFile objects which failed to be synthesised.
+        """
+        directory = Path(directory)
+        limit = self.concurrency(model)
+
+        def task(sound_file: SoundFile) -> None:
+            path = directory / f"{sound_file.path}.wav"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.process(path, sound_file.text, model)
+
+        return process_queue(
+            task, sound_files, workers=min(max_workers or limit, limit)
+        )
@@ -1,22 +1,129 @@
 """Helper functions for OpenVoicePacks.
 
-Includes metadata, file path validation, and JSON fetching from URLs.
+Includes metadata, logging and template configuration, file path validation, and JSON
+fetching from URLs.
 """
 
 import json
+import logging
 import os
-from importlib.metadata import metadata as meta
+import stat
+import sys
+import time
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError, URLError
 from urllib.request import urlopen
 
-# Package metadata, originates from pyproject.toml
-metadata = meta("openvoicepacks").json
+if TYPE_CHECKING:
+    import jinja2
 
-# Convert project_url list to a dictionary
-metadata["url"] = {}
-for item in metadata["project_url"]:
-    key, value = item.split(", ", 1)
-    metadata["url"][key] = value
+
+@cache
+def _load_metadata() -> dict:
+    """Load package metadata, which originates from pyproject.toml.
+
+    The project_url list is converted to a dictionary under the "url" key.
+    """
+    from importlib.metadata import metadata as meta  # NOQA: PLC0415
+
+    data = meta("openvoicepacks").json
+    data["url"] = dict(item.split(", ", 1) for item in data["project_url"])
+    return data
+
+
+def __getattr__(name: str) -> object:
+    """Lazily expose package metadata as the metadata module attribute.
+
+    Metadata is parsed on first access, and only once per process, rather than
+    whenever this module is imported.
+    """
+    if name == "metadata":
+        return _load_metadata()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+_LOGFORMAT = "%(asctime)s [%(levelname)s] [%(name)s] %(message)s"
+
+
+def configure_logging(level: str | None = None) -> None:
+    """Configure log output on the root logger.
+
+    This is called by the CLI entry point, rather than on import, so that library users
+    keep control of their own logging configuration. If the root logger already has
+    handlers only its level is changed. Coloured output is only installed when writing
+    to a terminal.
+
+    Args:
+        level (str, optional): Log level to use. Defaults to the OVP_LOG_LEVEL
+            environment variable, or INFO if that is not set.
+    """
+    loglevel = (level or os.environ.get("OVP_LOG_LEVEL", "INFO")).upper()
+
+    if logging.root.hasHandlers():
+        logging.root.setLevel(loglevel)
+    elif sys.stderr.isatty():
+        import coloredlogs  # NOQA: PLC0415
+
+        coloredlogs.install(level=loglevel, fmt=_LOGFORMAT)
+    else:
+        logging.basicConfig(level=loglevel, format=_LOGFORMAT)
+
+
+def cache_dir(*parts: str) -> Path:
+    """Return a path within the OpenVoicePacks user cache directory.
+
+    The cache lives in $OVP_CACHE_DIR if set, otherwise in an "openvoicepacks"
+    directory under $XDG_CACHE_HOME (defaulting to ~/.cache). The directory is not
+    created by this function.
+
+    Args:
+        *parts (str): Path components to join onto the cache directory.
+
+    Returns:
+        Path: The cache path.
+    """
+    root = os.environ.get("OVP_CACHE_DIR")
+    if not root:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        root = Path(xdg_cache) / "openvoicepacks"
+    return Path(root, *parts)
+
+
+# Templates shipped with the package, compiled when the environment is created.
+_TEMPLATES = ("voicepack.yaml.jinja", "functions.jinja")
+
+
+@cache
+def get_template_env() -> "jinja2.Environment":
+    """Return the Jinja2 environment used to render OpenVoicePacks templates.
+
+    The environment is created on first use and shared across renders. Compiled
+    templates are kept in the user cache directory, so later processes can skip
+    parsing them again.
+    """
+    import jinja2  # NOQA: PLC0415
+
+    bytecode_dir = cache_dir("jinja")
+    try:
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        bytecode_cache = None  # Cache directory is not writable, compile in memory.
+    else:
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(bytecode_dir))
+
+    env = jinja2.Environment(
+        loader=jinja2.PackageLoader("openvoicepacks"),
+        autoescape=jinja2.select_autoescape(),
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+    )
+    env.globals["metadata"] = _load_metadata()
+    for name in _TEMPLATES:
+        env.get_template(name)
+    return env
 
 
 def validate_file_path(file_path: str | Path) -> None:
@@ -36,19 +143,71 @@ def validate_file_path(file_path: str | Path) -> None:
         dir_path = Path(file_path).parent or Path()
     else:
         raise TypeError("file_path must be a string or Path object")
-    if not dir_path.exists():
+    try:
+        dir_stat = dir_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         msg = f"Directory '{dir_path}' does not exist"
+        raise ValueError(msg) from None
+    except PermissionError:
+        msg = f"Directory '{dir_path}' is not accessible"
+        raise ValueError(msg) from None
+    if not stat.S_ISDIR(dir_stat.st_mode):
+        msg = f"'{dir_path}' is not a directory"
         raise ValueError(msg)
-    if not os.access(str(dir_path), os.W_OK):
+    # A single stat answers the common case of a directory owned by the current user,
+    # only falling back to an access check (another syscall) for anything else.
+    owner_writable = (
+        hasattr(os, "geteuid")
+        and dir_stat.st_uid == os.geteuid()
+        and dir_stat.st_mode & stat.S_IWUSR
+    )
+    if not owner_writable and not os.access(dir_path, os.W_OK):
         msg = f"Directory '{dir_path}' is not writable"
         raise ValueError(msg)
 
 
-def json_from_url(url: str) -> dict | list:
+# Seconds to wait for a URL to respond, and attempts made on connection errors.
+URL_TIMEOUT = 10
+URL_ATTEMPTS = 3
+
+
+def _read_url(url: str, timeout: float = URL_TIMEOUT) -> bytes:
+    """Fetch and return the body of a given http or https URL.
+
+    Connection errors and timeouts are retried with a short exponential backoff.
+
+    Args:
+        url (str): The URL to fetch.
+        timeout (float, optional): Seconds to wait for a response.
+
+    Raises:
+        ValueError: If the URL is not http or https.
+    """
+    if not url.startswith(("http:", "https:")):
+        raise ValueError("URL must start with 'http:' or 'https:'")
+
+    for attempt in range(URL_ATTEMPTS - 1):
+        try:
+            return _urlopen_read(url, timeout)
+        except HTTPError:
+            raise  # The server responded, so retrying will not help.
+        except (URLError, TimeoutError):
+            time.sleep(0.2 * 2**attempt)
+    return _urlopen_read(url, timeout)
+
+
+def _urlopen_read(url: str, timeout: float) -> bytes:
+    """Open a URL and return the response body."""
+    with urlopen(url, timeout=timeout) as response:  # NOQA: S310
+        return response.read()
+
+
+def json_from_url(url: str, timeout: float = URL_TIMEOUT) -> dict | list:
     """Fetch and return JSON data from a given URL.
 
     Args:
         url (str): The URL to fetch JSON data from.
+        timeout (float, optional): Seconds to wait for a response. Defaults to 10.
 
     Returns:
         dict | list: The JSON data retrieved from the URL.
@@ -56,24 +215,17 @@ def json_from_url(url: str) -> dict | list:
     Raises:
         ValueError: If the URL is invalid or the data cannot be fetched.
     """
-    if not url.startswith(("http:", "https:")):
-        raise ValueError("URL must start with 'http:' or 'https:'")
-
-    with urlopen(url) as response:  # NOQA: S310
-        return json.load(response)
+    return json.loads(_read_url(url, timeout))
 
 
-def text_from_url(url: str) -> str:
+def text_from_url(url: str, timeout: float = URL_TIMEOUT) -> str:
     """Fetch and return text data from a given URL.
 
     Args:
         url (str): The URL to fetch text data from.
+        timeout (float, optional): Seconds to wait for a response. Defaults to 10.
 
     Returns:
         str: The text data retrieved from the URL.
     """
-    if not url.startswith(("http:", "https:")):
-        raise ValueError("URL must start with 'http:' or 'https:'")
-
-    with urlopen(url) as response:  # NOQA: S310
-        return response.read().decode("utf-8")
+    return _read_url(url, timeout).decode("utf-8")
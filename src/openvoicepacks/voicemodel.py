@@ -14,6 +14,9 @@ from attr import Attribute, define, field
 
 from openvoicepacks.plugin_registry import get_provider_class
 
+# Two lowercase letters, underscore or hyphen, two uppercase letters.
+_LANG_RE = re.compile(r"^[a-z]{2}[-_][A-Z]{2}$")
+
 
 @define
 class VoiceModel:
@@ -67,6 +70,6 @@ class VoiceModel:
         # Match two lowercase letters, underscore or hyphen, two uppercase letters.
         # This ensures that strings are valid ISO codes (two-letter ISO 639-1 for
         # language and two-letter ISO 3166-1 alpha-2 for region).
-        if not re.match(r"^[a-z]{2}[-_][A-Z]{2}$", value):
+        if not _LANG_RE.match(value):
             msg = f"{attr.name} must be in the format 'xx_YY' or 'xx-YY'"
             raise ValueError(msg)
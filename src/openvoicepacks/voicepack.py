@@ -8,17 +8,88 @@ methods for handling voice packs, as well as utility functions for converting fr
 and YAML formats into VoicePack objects.
 """
 
+import asyncio
+import contextlib
+import copy
 import csv
+import hashlib
 import io
+import logging
+import os
+import pickle
+import sys
+import threading
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
-import yaml
 from attr import define, field
 
-from openvoicepacks import template_env
 from openvoicepacks.audio import SoundFile
+from openvoicepacks.providers import Provider
+from openvoicepacks.utils import cache_dir, get_template_env
 from openvoicepacks.voicemodel import VoiceModel
+from openvoicepacks.worker import process_queue
+
+if TYPE_CHECKING:
+    import jinja2
+
+_logger = logging.getLogger(__name__)
+
+
+@cache
+def _voicepack_template() -> "jinja2.Template":
+    """Return the voice pack YAML template, looked up once and reused for every save.
+
+    The template is resolved on first use rather than at import, so importing this
+    module does not load Jinja2.
+    """
+    return get_template_env().get_template("voicepack.yaml.jinja")
+
+
+@lru_cache(maxsize=1024)
+def _directory_key(directory: str) -> str:
+    """Return the interned, lowercase sounds dict key for a directory name.
+
+    Voice packs repeat a handful of directory names across many sounds, so each is
+    only converted once and every sound shares the same string.
+    """
+    return sys.intern(directory.lower())
+
+
+@lru_cache(maxsize=1024)
+def _directory_prefix(directory: str) -> str:
+    """Return the interned, uppercase sound file path prefix for a directory name."""
+    return sys.intern(f"{directory.upper()}/") if directory else ""
+
+
+def _normalise_packname(value: str) -> str:
+    """Return a pack name as a lowercase filename, without directories or suffix.
+
+    Spaces become underscores. This matches treating the name as a path and taking
+    its stem, without building a Path object for every voice pack.
+
+    Raises:
+        ValueError: If the pack name is empty.
+    """
+    parts = [p for p in value.replace(" ", "_").lower().split("/") if p]
+    name = next((p for p in reversed(parts) if p != "."), ".")
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        name = name[:dot]
+    if name == ".":
+        msg = f"Pack name {value!r} has an empty name"
+        raise ValueError(msg)
+    return name
+
+
+def _to_voicemodel(value: dict | VoiceModel | None) -> VoiceModel | None:
+    """Convert a voice model configuration dict, such as from YAML, to a VoiceModel."""
+    if isinstance(value, dict):
+        return VoiceModel(**value)
+    return value
 
 
 @define
@@ -36,87 +107,206 @@ class VoicePack:
         creator (str): Creator name (optional).
         contact (str): Contact information (optional).
         packname (str): Filename (optional), defaults to name with underscores.
-        model (VoiceModel | None): Optional VoiceModel configuration.
-        sounds (dict): Nested dictionary of sounds.
+        model (VoiceModel | None): Optional VoiceModel configuration, a dict is
+            converted to a VoiceModel.
+        sounds (dict): Nested dictionary of sounds. Directories must be plain dicts,
+            as YAML, JSON and CSV loading produce, rather than other mappings.
         creation_date (datetime): Timestamp of creation.
         based_on (list[str]): Optional reference to parent voice packs.
     """
 
     name: str
-    model: dict | VoiceModel | None = None
-    packname: str = field(
-        converter=staticmethod(
-            lambda v: Path(v.replace(" ", "_").lower()).with_suffix("").name
-        )
-    )
+    model: VoiceModel | None = field(default=None, converter=_to_voicemodel)
+    packname: str = field(converter=_normalise_packname)
     ovp_schema: int = field(converter=int, default=1)
     description: str = field(default="")
     creator: str = field(default="")
     contact: str = field(default="")
-    sounds: dict = field(default={}, repr=False)
-    creation_date: datetime = field(default=datetime.now(UTC), repr=False)
-    based_on: list[str] = field(default=[], repr=False)
+    sounds: dict = field(factory=dict, repr=False)
+    creation_date: datetime = field(factory=lambda: datetime.now(UTC), repr=False)
+    based_on: list[str] = field(factory=list, repr=False)
 
     @packname.default
     def _set_default_packname(self) -> str:
         """Set the default packname based on the name attribute."""
         return self.name
 
-    def _flatten_sounds(
-        self, d: dict, parent_keys: list[str] | None = None
-    ) -> list["SoundFile"]:
-        """Recursively flattens a nested dict into a list of SoundFile objects.
+    @classmethod
+    def from_soundfiles(
+        cls, name: str, sound_files: list[SoundFile], **kwargs: object
+    ) -> "VoicePack":
+        """Create a VoicePack from a flat list of SoundFile objects.
+
+        Each sound file is added under its directory, which is a single sounds key as
+        for CSV paths, so "A/B/hello" is stored as {"a/b": {"hello": ...}}. Where paths
+        repeat, the last sound file wins.
+
+        Args:
+            name (str): Name of the voice pack.
+            sound_files (list): SoundFile objects, with any directory in their paths.
+            **kwargs: Additional VoicePack attributes.
+
+        Returns:
+            VoicePack: The new voice pack.
+        """
+        sounds: dict = {}
+        for sound_file in sound_files:
+            directory, _, filename = sound_file.path.rpartition("/")
+            level = (
+                sounds.setdefault(_directory_key(directory), {})
+                if directory
+                else sounds
+            )
+            level[filename] = sound_file.text
+
+        return cls(name=name, sounds=sounds, **kwargs)
+
+    def _iter_sounds(self, d: dict) -> Iterator[SoundFile]:
+        """Flatten a nested dict, yielding a SoundFile for each sound.
 
         Key path is joined by '/' and directories are made uppercase to conform to
-        EdgeTX/OpenTX conventions.
+        EdgeTX/OpenTX conventions. Sounds are yielded depth-first in dict order, using
+        an explicit stack rather than recursion.
 
         Args:
-            d (dict): The current level of the sounds dictionary.
-            parent_keys (list[str] | None): List of parent keys for path construction.
+            d (dict): The sounds dictionary.
+
+        Yields:
+            SoundFile: A sound file for each sound in the dict.
         """
-        if parent_keys is None:
-            parent_keys = []
-
-        for i, k in enumerate(parent_keys):
-            parent_keys[i] = k.upper()  # Ensure directory keys are uppercase
-        items = []
-        for k, v in d.items():
-            key_str = str(k)
-            new_keys = [*parent_keys, key_str]
-            if isinstance(v, dict):
-                items.extend(self._flatten_sounds(v, new_keys))
+        # Each level keeps its already joined, uppercased path prefix, so directory
+        # names are converted once rather than once per sound beneath them. Prefixes
+        # are interned, so every worklist built shares the same strings.
+        stack = [(iter(d.items()), "")]
+        while stack:
+            entries, prefix = stack[-1]
+            for k, v in entries:
+                # An exact type check is cheaper than isinstance(), and every loader
+                # produces plain dicts.
+                if type(v) is dict:
+                    # Descend, picking up with this dict's next key once done.
+                    directory = sys.intern(f"{prefix}{str(k).upper()}/")
+                    stack.append((iter(v.items()), directory))
+                    break
+                yield SoundFile(path=f"{prefix}{k}", text=v)
             else:
-                key_path = "/".join(new_keys)
-                items.append(SoundFile(path=key_path, text=v))
-        return items
+                stack.pop()
+
+    def iter_worklist(self) -> Iterator[SoundFile]:
+        """Yield every sound in the voice pack, without building a list first.
+
+        Sounds should not be changed while the worklist is being iterated.
+        """
+        return self._iter_sounds(self.sounds)
 
     def worklist(self) -> list[SoundFile]:
         """Return a flattened list of all sounds in the voice pack."""
-        return self._flatten_sounds(self.sounds)
+        return list(self.iter_worklist())
+
+    def synthesise_all(
+        self, provider: Provider | None = None, max_workers: int | None = None
+    ) -> list[SoundFile]:
+        """Synthesise every sound in the voice pack concurrently.
+
+        Audio is assigned to each SoundFile as its synthesis completes. Sounds which
+        fail to synthesise are logged and left without audio.
+
+        Args:
+            provider (Provider, optional): Provider instance to synthesise with.
+                Defaults to a new instance of the voice model's provider.
+            max_workers (int, optional): Maximum number of worker threads.
+                Defaults to, and is limited to, the provider's concurrency limit.
+
+        Returns:
+            list: SoundFile objects for all sounds in the voice pack.
+
+        Raises:
+            ValueError: If the voice pack has no voice model.
+        """
+        model = self.model
+        if model is None:
+            raise ValueError("Voice pack has no voice model to synthesise with")
+        if provider is None:
+            provider = model.provider()
+
+        def task(sound_file: SoundFile) -> None:
+            sound_file.audio = provider.synthesise(sound_file.text, model)
+
+        limit = provider.concurrency(model)
+        worklist = self.worklist()
+        process_queue(task, worklist, workers=min(max_workers or limit, limit))
+        return worklist
+
+    async def async_synthesise_all(
+        self, provider: Provider | None = None, max_workers: int | None = None
+    ) -> list[SoundFile]:
+        """Synthesise every sound in the voice pack from an asyncio event loop.
+
+        Behaves like synthesise_all(), with a semaphore limiting how many requests
+        are in flight at once.
+
+        Args:
+            provider (Provider, optional): Provider instance to synthesise with.
+                Defaults to a new instance of the voice model's provider.
+            max_workers (int, optional): Maximum number of concurrent requests.
+                Defaults to, and is limited to, the provider's concurrency limit.
+
+        Returns:
+            list: SoundFile objects for all sounds in the voice pack.
+
+        Raises:
+            ValueError: If the voice pack has no voice model.
+        """
+        model = self.model
+        if model is None:
+            raise ValueError("Voice pack has no voice model to synthesise with")
+        if provider is None:
+            provider = model.provider()
+
+        limit = provider.concurrency(model)
+        semaphore = asyncio.Semaphore(min(max_workers or limit, limit))
+
+        async def task(sound_file: SoundFile) -> None:
+            async with semaphore:
+                try:
+                    sound_file.audio = await provider.async_synthesise(
+                        sound_file.text, model
+                    )
+                except Exception:
+                    _logger.exception("Failed to process %s", sound_file)
+
+        worklist = self.worklist()
+        await asyncio.gather(*(task(sound_file) for sound_file in worklist))
+        return worklist
 
     def yaml(self) -> str:
         """Return the voice pack data as a YAML document."""
-        template = template_env.get_template("voicepack.yaml.jinja")
-        return template.render(voicepack=self)
+        return _voicepack_template().render(voicepack=self)
 
-    def save(self, filename: str | None = None) -> str:
+    def save(self, filename: str | Path | TextIO | None = None) -> str | Path | TextIO:
         """Save the voicepack data to a YAML file.
 
         Args:
-            filename (str): The filename to save the voice pack to.
+            filename (str | Path | TextIO): The filename or text stream to save the
+                voice pack to.
 
         The filename is derived from the packname attribute with a .yaml extension if
         not specified.
 
         Returns:
-            str: The filename the voice pack was saved to.
+            str | Path | TextIO: Where the voice pack was saved to.
         """
         # Default filename to packname.yaml if not specified.
         if not filename:
             filename = f"{self.packname}.yaml"
 
-        with Path.open(filename, "w", encoding="utf-8") as f:
-            f.write(self.yaml())
+        # Rendered straight to the file, without holding the whole document in memory.
+        stream = _voicepack_template().stream(voicepack=self)
+        if isinstance(filename, (str, os.PathLike)):
+            with Path(filename).open("w", encoding="utf-8") as f:
+                stream.dump(f)
+        else:
+            stream.dump(filename)
         return filename
 
     def merge(self, parent: object) -> None:
@@ -130,32 +320,85 @@ class VoicePack:
         """
 
         def merge_dicts(primary: dict, parent: dict) -> dict:
-            """Recursively merge two nested dictionaries.
+            """Recursively merge a nested dictionary into another, in place.
+
+            Only keys missing from primary are added, so no dicts are rebuilt for
+            sounds primary already has. Directories added from parent are copied, so
+            later changes to this voice pack do not reach into the parent.
 
             Args:
-                primary (dict): The first dictionary (takes precedence).
-                parent (dict): The second dictionary.
+                primary (dict): The dictionary to update (takes precedence).
+                parent (dict): The dictionary to merge from.
 
             Returns:
-                dict: The merged dictionary.
+                dict: The updated primary dictionary.
             """
-            result = dict(parent)  # Start with parent's keys and values
-            for k, v in primary.items():
-                if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                    result[k] = merge_dicts(v, result[k])
-                else:
-                    result[k] = v
-            return result
+            for k, v in parent.items():
+                if k not in primary:
+                    primary[k] = copy.deepcopy(v) if type(v) is dict else v
+                elif type(primary[k]) is dict and type(v) is dict:
+                    merge_dicts(primary[k], v)
+            return primary
 
         self.sounds = merge_dicts(self.sounds, parent.sounds)
         self.based_on.append(parent.packname)
 
 
-def voicepack_from_csv(csv_data: dict) -> VoicePack:
+def soundfiles_from_csv(
+    csv_data: str | bytes | Path | TextIO,
+) -> Iterator[SoundFile]:
+    """Read sound files from EdgeTX/OpenTX community CSV data, one row at a time.
+
+    Rows are turned straight into SoundFile objects as they are read, so large CSV
+    files are never held in memory as a whole.
+
+    Args:
+        csv_data (str | bytes | Path | TextIO): The CSV data, as text or UTF-8 bytes, a
+            path to a CSV file, or a text stream to read it from.
+
+    Yields:
+        SoundFile: A sound file for each row, nested in any path given.
+
+    Raises:
+        ValueError: If the CSV data is not formatted correctly.
+    """
+    if isinstance(csv_data, Path):
+        with csv_data.open(encoding="utf-8", newline="") as csv_file:
+            yield from soundfiles_from_csv(csv_file)
+        return
+    if isinstance(csv_data, bytes):
+        # Decode in one pass, rather than wrapping the bytes in a decoding stream.
+        csv_data = csv_data.decode("utf-8")
+    if isinstance(csv_data, str):
+        csv_data = io.StringIO(csv_data)
+
+    # Rows are read as plain lists, with the field positions found once from the
+    # header, rather than building a dict for every row. csv.reader parses in C, so
+    # avoid wrapping it in a Python-level row generator.
+    reader = csv.reader(csv_data)
+    header = next(reader, [])
+
+    # Check CSV data is in the correct format.
+    required_fields = ["Filename", "Path", "Translation"]
+    if not set(required_fields).issubset(header):
+        raise ValueError("CSV not formatted correctly")
+    filename_index, path_index, text_index = map(header.index, required_fields)
+
+    for row in reader:
+        if not row:
+            continue  # Skip blank lines, as csv.DictReader does.
+        filename = row[filename_index].removesuffix(".wav")
+        yield SoundFile(
+            path=_directory_prefix(row[path_index]) + filename, text=row[text_index]
+        )
+
+
+def voicepack_from_csv(csv_data: str | bytes | Path | TextIO) -> VoicePack:
     """Convert CSV data from EdgeTX/OpenTX community to a VoicePack object.
 
     Args:
-        csv_data (dict): The CSV data to convert.
+        csv_data (str | bytes | Path | TextIO): The CSV data to convert, as text or
+            UTF-8 bytes, or a path to a CSV file to read it from.
 
     Returns:
         VoicePack: The converted VoicePack object.
@@ -164,50 +407,129 @@ def voicepack_from_csv(csv_data: dict) -> VoicePack:
         ValueError: If the CSV data is not formatted correctly.
     """
     # Since the CSV format does not include metadata, we set some defaults.
-    data = {
-        "ovp_schema": 1,
-        "name": "Unnamed",
-        "description": "Imported from CSV",
-        "sounds": {},
-    }
+    return VoicePack.from_soundfiles(
+        "Unnamed",
+        list(soundfiles_from_csv(csv_data)),
+        ovp_schema=1,
+        description="Imported from CSV",
+    )
 
-    if isinstance(csv_data, str):
-        csv_data = io.StringIO(csv_data)
 
-    # Load CSV data as a list of dicts where each field is a key.
-    csv_dict = csv.DictReader(csv_data)
+def _load_yaml(yaml_data: str | TextIO) -> dict:
+    """Parse a YAML document, using libyaml when PyYAML was built with it."""
+    import yaml  # NOQA: PLC0415
 
-    # Check CSV data is in the correct format.
-    required_fields = ["Filename", "Path", "Translation"]
-    for f in required_fields:
-        if f not in csv_dict.fieldnames:
-            raise ValueError("CSV not formatted correctly")
-
-    # Convert the CSV data into the standard OSP format.
-    for row in csv_dict:
-        filename = row.get("Filename").replace(".wav", "")
-        string = row.get("Translation")
-        path = row.get("Path").lower()
-
-        # If there is a path attribute set, nest the values inside that.
-        if len(path) > 0:
-            if path not in data["sounds"]:
-                data["sounds"][path] = {}
-            data["sounds"][path][filename] = string
-        else:
-            data["sounds"][filename] = string
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(yaml_data, Loader=loader)  # NOQA: S506
 
-    return VoicePack(**data)
 
+# Voice packs are often loaded from the same YAML repeatedly, such as parents when
+# merging, so parsed documents are kept and copied rather than parsed again; copying
+# is around ten times faster than parsing with libyaml. They are keyed by a digest of
+# the YAML, so the text itself is not kept in memory.
+_PARSED_YAML_SIZE = 128
+_parsed_yaml: dict[bytes, dict] = {}
+_parsed_yaml_lock = threading.Lock()
 
-def voicepack_from_yaml(yaml_data: dict) -> VoicePack:
+
+def _parse_yaml(yaml_data: str) -> dict:
+    """Parse a YAML string, reusing the document parsed from the same YAML before.
+
+    The returned document is shared, so must be copied before it is changed.
+    """
+    key = hashlib.blake2b(yaml_data.encode(), digest_size=16).digest()
+    with _parsed_yaml_lock:
+        data = _parsed_yaml.get(key)
+    if data is None:
+        data = _load_yaml(yaml_data)
+        with _parsed_yaml_lock:
+            if len(_parsed_yaml) >= _PARSED_YAML_SIZE:
+                del _parsed_yaml[next(iter(_parsed_yaml))]  # Forget the oldest
+            _parsed_yaml[key] = data
+    return data
+
+
+# Marks parsed YAML cache files, so files from an incompatible version are ignored.
+_YAML_CACHE_HEADER = b"OVPv1\n"
+# Most parsed YAML files kept, the least recently used are removed beyond this. Files
+# for YAML that has since moved or been deleted are never used again, so age out.
+_YAML_CACHE_FILES = 256
+
+
+def _prune_yaml_cache(directory: Path) -> None:
+    """Remove the least recently used parsed YAML until _YAML_CACHE_FILES remain."""
+    try:
+        with os.scandir(directory) as it:
+            entries = [
+                (entry.stat().st_mtime, Path(entry.path))
+                for entry in it
+                if entry.name.endswith(".pickle")
+            ]
+    except OSError:
+        return  # No cache yet.
+
+    entries.sort()
+    for _, cache_file in entries[: max(len(entries) - _YAML_CACHE_FILES, 0)]:
+        cache_file.unlink(missing_ok=True)
+
+
+def _load_yaml_file(path: Path) -> dict:
+    """Parse a YAML file, reusing the parsed document from a previous run if unchanged.
+
+    Parsed documents are pickled in the user cache directory, keyed by the file's
+    resolved path, and reused while the file's modification time and size match. Only
+    the _YAML_CACHE_FILES most recently used documents are kept.
+    """
+    path_stat = path.stat()
+    stamp = (path_stat.st_mtime_ns, path_stat.st_size)
+    key = hashlib.sha256(os.fsencode(path.resolve())).hexdigest()
+    cache_file = cache_dir("yaml", f"{key}.pickle")
+    try:
+        cached = cache_file.read_bytes()
+        if cached.startswith(_YAML_CACHE_HEADER):
+            cached_stamp, data = pickle.loads(cached[len(_YAML_CACHE_HEADER) :])  # NOQA: S301
+            if cached_stamp == stamp:
+                with contextlib.suppress(OSError):
+                    os.utime(cache_file)  # Mark as recently used for pruning.
+                return data
+    except Exception:  # NOQA: BLE001
+        # Missing, unreadable or outdated cache (unpickling can fail in many ways,
+        # such as a different shape or classes that moved), so parse the file again.
+        _logger.debug('Ignoring unusable parsed YAML cache at "%s".', cache_file)
+
+    data = _load_yaml(path.read_text(encoding="utf-8"))
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(_YAML_CACHE_HEADER + pickle.dumps((stamp, data)))
+        tmp_file.replace(cache_file)
+    except OSError:
+        _logger.debug('Unable to cache parsed YAML at "%s".', cache_file)
+    else:
+        _prune_yaml_cache(cache_file.parent)
+    return data
+
+
+def voicepack_from_yaml(yaml_data: str | Path | TextIO) -> VoicePack:
     """Convert YAML data to a VoicePack object.
 
+    The libyaml based loader is used when PyYAML was built with it, as it parses
+    several times faster than the pure Python loader. Parsed YAML strings are cached,
+    so loading the same document again skips parsing, and parsed YAML files are kept
+    in the user cache directory until the file changes.
+
     Args:
-        yaml_data (dict): The YAML data to convert.
+        yaml_data (str | Path | TextIO): The YAML data to convert, or a path to a
+            YAML file to read it from.
 
     Returns:
         VoicePack: The converted VoicePack object.
     """
-    data = yaml.safe_load(yaml_data)
+    if isinstance(yaml_data, Path):
+        data = _load_yaml_file(yaml_data)
+    elif isinstance(yaml_data, str):
+        # Copied so voice packs do not share, and modify, the cached document.
+        data = copy.deepcopy(_parse_yaml(yaml_data))
+    else:
+        data = _load_yaml(yaml_data)
     return VoicePack(**data)
@@ -1,58 +1,62 @@
-"""Worker functions for processing sound generation tasks in parallel."""
+"""Worker functions for processing sound generation tasks in parallel.
 
-import logging
-
-logger = logging.getLogger(__name__)
-
-
-# def worker(generator: Any, sound: Any) -> None:
-#     """Process a single sound generation task."""
-#     try:
-#         # sound.generate(generator)
-#         print(sound)
-#         logger.info(f"Generated sound: {sound}")
-#     except Exception as e:
-#         logger.error(f"Error generating {sound}: {e}")
-
-
-# def process_queue(generator: Any, worklist: Sequence[Any], workers: int = 16) -> None:
-#     """Process a list of sound tasks in parallel using threads."""
-#     with ThreadPoolExecutor(max_workers=workers) as executor:
-#         futures = [executor.submit(worker, generator, item) for item in worklist]
-#         for future in as_completed(futures):
-#             # Optionally handle results or exceptions here
-#             try:
-#                 future.result()
-#             except Exception as exc:
-#                 logger.error(f"Worker thread failed: {exc}")
-
-
-# Example usage:
-# if __name__ == "__main__":
-#     generator = ...  # Your generator object
-#     worklist = [...] # List of sound objects
-#     process_queue(generator, worklist, workers=4)
-# def worker(generator, sound):
-#     try:
-#         sound.generate(generator)
-#     except Exception as e:
-#         logger.error(e)
-#         # logger.critical(f'{sound} has no ')
-#         # raise Exception('ooo')
+Sound generation is dominated by ONNX inference (which releases the GIL) or network
+requests, so a thread pool scales well without the cost of spawning processes.
+"""
 
-
-# def queue(generator, worklist: list, workers=3):
-#     from concurrent.futures import ThreadPoolExecutor
-
-#     with ThreadPoolExecutor(max_workers=workers) as executor:
-#         for item in worklist:
-#             executor.submit(worker, generator, item)
-
-
-# from concurrent.futures import ThreadPoolExecutor
-
-# ff = ['one', 'two', 'three', 'fish']
-
-# with ThreadPoolExecutor(max_workers=3) as executor:
-#     for i in ff:
-#         executor.submit(worker, f, Sound(i))
+import logging
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+_logger = logging.getLogger(__name__)
+
+# Tasks queued per worker thread, keeping workers busy without queueing everything.
+QUEUE_DEPTH = 2
+
+
+def default_workers() -> int:
+    """Return the default number of worker threads."""
+    return os.cpu_count() or 1
+
+
+def process_queue[T](
+    task: Callable[[T], object], worklist: Iterable[T], workers: int | None = None
+) -> list[T]:
+    """Process a list of sound tasks in parallel using threads.
+
+    Errors raised by a task are logged and do not stop the remaining tasks. Only a
+    few tasks per worker are queued at a time, so the worklist can be a generator
+    which is consumed as tasks complete, rather than all at once.
+
+    Args:
+        task (Callable): Function called with each item of the worklist.
+        worklist (Iterable): Items to process.
+        workers (int, optional): Maximum number of worker threads.
+            Defaults to the number of CPUs.
+
+    Returns:
+        list: Items for which the task raised an exception.
+    """
+    workers = workers or default_workers()
+    items = iter(worklist)
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = {
+            executor.submit(task, item): item
+            for item in islice(items, workers * QUEUE_DEPTH)
+        }
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = in_flight.pop(future)
+                try:
+                    future.result()
+                except Exception:
+                    _logger.exception("Failed to process %s", item)
+                    failed.append(item)
+            # Top the queue back up with as many tasks as just completed.
+            for item in islice(items, len(done)):
+                in_flight[executor.submit(task, item)] = item
+    return failed
@@ -17,56 +17,150 @@ Usage:
         inv <task_name> --help
 """
 
+import hashlib
 import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-from invoke import Context, task
+from invoke import Context, Exit, task
 
 OCI_IMAGE_NAME = "openvoicepacks"
 OCI_BUILDER = os.getenv("OCI_BUILDER", "buildah")
 
+# Ruff only re-checks files that changed since its last run. Pinning the cache location
+# lets CI restore it between runs; cache .ruff_cache/ alongside the uv cache.
+RUFF_ENV = {"RUFF_CACHE_DIR": os.getenv("RUFF_CACHE_DIR", ".ruff_cache")}
+
+# Digest of the sources at the last passing test run, so unchanged trees are skipped.
+TEST_CACHE = Path(".ovp_test_cache")
+
+
+def _exec(*argv: str, env: dict[str, str] | None = None) -> None:
+    """Run a single command directly, without starting a shell to parse it.
+
+    The command inherits this process's stdout, so tools still see a terminal when
+    there is one. Interactive tasks, such as commit, use command.run with a pty.
+
+    Args:
+        *argv (str): Program and arguments to run.
+        env (dict, optional): Extra environment variables to set for the command.
+
+    Raises:
+        Exit: If the command fails, exiting with the same return code.
+    """
+    if env:
+        env = {**os.environ, **env}
+    returncode = subprocess.run(argv, check=False, env=env).returncode  # NOQA: S603
+    if returncode:
+        raise Exit(code=returncode)
+
+
+def _sources_digest(command: Context, *, all_: bool) -> str:
+    """Return a digest of the tracked and new files the test suite depends on."""
+    files = command.run(
+        "git ls-files -z --cached --others --exclude-standard"
+        " -- src tests pyproject.toml uv.lock",
+        hide=True,
+    ).stdout.split("\0")
+    # A run without --all skips slow tests, so it does not vouch for a run with it.
+    digest = hashlib.blake2b(b"all" if all_ else b"", digest_size=16)
+    for name in sorted(filter(None, files)):
+        path = Path(name)
+        if path.is_file():
+            digest.update(f"{name}\0{path.stat().st_size}\0".encode())
+            with path.open("rb") as f:
+                # Stream each file into the shared digest, instead of reading it whole.
+                hashlib.file_digest(f, lambda: digest)
+    return digest.hexdigest()
+
 
 # TODO: Consider swapping fix flag to --check for fmt and lint.
 @task(
     aliases=(["format"]),
     help={"fix": "Automatically fix formatting issues."},
 )
-def fmt(command: Context, *, fix: bool = True) -> None:
+def fmt(command: Context, *, fix: bool = True) -> None:  # NOQA: ARG001
     """Format code."""
-    cmd = "ruff format"
+    cmd = ["ruff", "format"]
     if not fix:
-        cmd += " --diff"
-    command.run(f"{cmd}", pty=True)
+        cmd.append("--diff")
+    _exec(*cmd, env=RUFF_ENV)
 
 
 @task(help={"fix": "Automatically fix linting issues."})
-def lint(command: Context, *, fix: bool = True) -> None:
+def lint(command: Context, *, fix: bool = True) -> None:  # NOQA: ARG001
     """Run lint tests."""
-    cmd = "ruff check"
+    cmd = ["ruff", "check"]
     if fix:
-        cmd += " --fix"
-    command.run(cmd, pty=True)
+        cmd.append("--fix")
+    _exec(*cmd, env=RUFF_ENV)
+
+
+@task(help={"fix": "Automatically fix formatting and linting issues."})
+def check(command: Context, *, fix: bool = False) -> None:  # NOQA: ARG001
+    """Check linting and formatting."""
+    if fix:
+        # Both commands write files, so lint fixes are applied before formatting.
+        _exec("ruff", "check", "--fix", ".", env=RUFF_ENV)
+        _exec("ruff", "format", ".", env=RUFF_ENV)
+        return
+    # Checks only read files, so run both at once and report every failure.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        checks = [
+            pool.submit(_exec, "ruff", "check", ".", env=RUFF_ENV),
+            pool.submit(_exec, "ruff", "format", "--check", ".", env=RUFF_ENV),
+        ]
+    for result in checks:
+        result.result()
 
 
 @task(aliases=(["coverage"]))
-def cov(command: Context) -> None:
+def cov(command: Context) -> None:  # NOQA: ARG001
     """Run code coverage report generation."""
-    command.run("coverage report -m", pty=True)
+    _exec("coverage", "report", "-m")
 
 
 @task(
     help={
         "all": "Run full test suite, including slow tests.",
         "benchmark": "Run benchmarks for the test suite.",
+        "parallel": "Run tests across all CPU cores. Use --no-parallel to debug.",
+        "failed": "Only rerun tests which failed last time, or run them first.",
+        "ci": "Do not write the pytest cache. Implied by CI, excludes --failed.",
     },
 )
-def unit(command: Context, *, all_: bool = False, benchmark: bool = False) -> None:
+def unit(  # NOQA: PLR0913
+    command: Context,  # NOQA: ARG001
+    *,
+    all_: bool = False,
+    benchmark: bool = False,
+    parallel: bool = True,
+    failed: bool = False,
+    ci: bool = False,
+) -> None:
     """Run unit tests."""
-    cmd = "pytest"
+    no_cache = ci or bool(os.getenv("CI"))
+    if failed and no_cache:
+        # pytest only knows what failed from its cache, which CI runs disable.
+        raise Exit("--failed needs the pytest cache, which --ci (or CI) disables.", 1)
+    cmd = ["pytest"]
+    if parallel:
+        # Keep each module on one worker, so module scoped fixtures are built once.
+        cmd += ["-n", "auto", "--dist", "loadfile"]
     if not all_:
-        cmd += " -m 'not slow'"
+        cmd += ["-m", "not slow"]
     if benchmark:
-        cmd += " --durations=5 --durations-min=1.0"
-    command.run(cmd, pty=True)
+        cmd += ["--durations=5", "--durations-min=1.0"]
+    if failed:
+        # Without a record of failures, --lf would run everything in no useful order.
+        last_failed = Path(".pytest_cache/v/cache/lastfailed").is_file()
+        cmd.append("--lf" if last_failed else "--ff")
+    if no_cache:
+        # CI checkouts are thrown away, so the cache would never be read again.
+        cmd += ["-p", "no:cacheprovider"]
+    _exec(*cmd)
 
 
 @task(aliases=["pre-commit"])
@@ -79,35 +173,59 @@ def pre(command: Context) -> None:
     help={
         "all": "Run full test suite, including slow tests.",
         "fix": "After checking formatting and linting, make the necessary changes.",
+        "parallel": "Run tests across all CPU cores. Use --no-parallel to debug.",
+        "force": "Run even if nothing has changed since the last passing run.",
     },
 )
-def test(command: Context, *, all_: bool, fix: bool) -> None:
-    """Run full test suite."""
-    fmt(command, fix=fix)
-    lint(command, fix=fix)
-    unit(command, all_=all_)
+def test(
+    command: Context,
+    *,
+    all_: bool,
+    fix: bool,
+    parallel: bool = True,  # NOQA: PT028
+    force: bool = False,  # NOQA: PT028
+) -> None:
+    """Run full test suite, unless nothing has changed since it last passed."""
+    digest = _sources_digest(command, all_=all_)
+    if not force and TEST_CACHE.is_file() and TEST_CACHE.read_text() == digest:
+        print("Nothing to do, no changes since the last passing run.")  # NOQA: T201
+        return
+    check(command, fix=fix)
+    unit(command, all_=all_, parallel=parallel)
     cov(command)
+    if fix:
+        # Fixes change the sources, record the digest of what actually passed.
+        digest = _sources_digest(command, all_=all_)
+    TEST_CACHE.write_text(digest)
 
 
 @task
-def dependencies(command: Context) -> None:
+def dependencies(command: Context) -> None:  # NOQA: ARG001
     """Install dependencies."""
-    command.run("uv sync --all-groups", pty=True)
+    _exec("uv", "sync", "--all-groups")
 
 
 @task
-def update(command: Context) -> None:
+def update(command: Context) -> None:  # NOQA: ARG001
     """Update dependencies."""
-    command.run("uv lock --upgrade --all-groups", pty=True)
+    _exec("uv", "lock", "--upgrade", "--all-groups")
 
 
 @task
-def clean(command: Context) -> None:
+def clean(command: Context) -> None:  # NOQA: ARG001
     """Clean development environment, removing temporary files."""
-    command.run("find . -type d -name '__pycache__' -exec rm -rf {} +")
-    command.run("rm -rf dist/ site/ .pytest_cache/ .cache/plugin/social/*.png")
-    # These will probably go away
-    command.run("rm -rf resources/")
+    # Removed in process, rather than forking find and rm for each step.
+    # .ruff_cache/ is deliberately kept, so linting stays incremental after a clean.
+    for root, dirs, _ in os.walk("."):
+        if "__pycache__" in dirs:
+            dirs.remove("__pycache__")
+            shutil.rmtree(Path(root, "__pycache__"), ignore_errors=True)
+    # resources/ will probably go away.
+    for path in ("dist", "site", ".pytest_cache", "resources"):
+        shutil.rmtree(path, ignore_errors=True)
+    TEST_CACHE.unlink(missing_ok=True)
+    for image in Path(".cache/plugin/social").glob("*.png"):
+        image.unlink(missing_ok=True)
 
 
 @task(
@@ -118,7 +236,7 @@ def docs(command: Context, *, serve: bool = False) -> None:
     if serve:
         command.run("mkdocs serve --livereload", pty=True)
     else:
-        command.run("mkdocs build", pty=True)
+        _exec("mkdocs", "build")
 
 
 @task(
@@ -155,12 +273,12 @@ def build(
 @task(
     help={"short": "Only show version number."},
 )
-def version(command: Context, *, short: bool = False) -> None:
+def version(command: Context, *, short: bool = False) -> None:  # NOQA: ARG001
     """Display package version."""
-    cmd = "uv version"
+    cmd = ["uv", "version"]
     if short:
-        cmd += " --short"
-    command.run(cmd, pty=True)
+        cmd.append("--short")
+    _exec(*cmd)
 
 
 @task
@@ -178,9 +296,9 @@ def commit(command: Context) -> None:
 
 
 @task
-def publish(command: Context) -> None:
+def publish(command: Context) -> None:  # NOQA: ARG001
     """Publish package to remote repository."""
-    command.run("uv publish", pty=True)
+    _exec("uv", "publish")
 
 
 @task
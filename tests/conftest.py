@@ -0,0 +1,37 @@
+"""Shared fixtures for the OpenVoicePacks test suite."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from openvoicepacks import utils
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ovp_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path]:
+    """Given any test, point the OpenVoicePacks cache at a temporary directory.
+
+    Keeps tests from writing parsed YAML, compiled templates and downloaded indexes
+    into the user's real cache directory. Set for the whole session, so module and
+    class scoped fixtures are covered too, and compiled templates are reused between
+    tests. Tests needing an empty cache set OVP_CACHE_DIR themselves.
+    """
+    cache_path = tmp_path_factory.mktemp("ovp_cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("OVP_CACHE_DIR", str(cache_path))
+        utils.get_template_env.cache_clear()
+        yield cache_path
+    utils.get_template_env.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_template_env() -> Generator[None]:
+    """Given any test, clear the template environment before and after it.
+
+    No environment outlives the test that made it, so none is left holding a bytecode
+    cache in a directory a test pointed OVP_CACHE_DIR at.
+    """
+    utils.get_template_env.cache_clear()
+    yield
+    utils.get_template_env.cache_clear()
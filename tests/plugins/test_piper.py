@@ -5,29 +5,44 @@ tests/providers/test_all.py to ensure consistency across all providers.
 
 Current tests:
 - Synthesising audio from text whilst downloading a new voice model.
+- Downloading a voice model only once for concurrent requests.
+- Synthesising text that yields no audio chunks.
 - Downloading valid and invalid voice models.
+- Reusing loaded voice models, and loading others whilst one is still loading.
+- Caching the index of available voice models.
 """
 
+import json
+import os
+import threading
+import time
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from openvoicepacks.audio import AudioData
+from openvoicepacks.plugins import piper
 from openvoicepacks.plugins.piper import Piper
 from openvoicepacks.voicemodel import VoiceModel
 
 
+@pytest.fixture(scope="module")
+def piper_model() -> VoiceModel:
+    """Given a test, returns a Piper voice object shared within the module."""
+    return VoiceModel(
+        voice="Alan",
+        language="en_GB",
+        provider="piper",
+        option="medium",
+    )
+
+
 class TestPiper:
     """Test suite for the Piper TTS provider."""
 
-    @pytest.fixture
-    def piper_model(self) -> VoiceModel:
-        """Given a test, returns a Piper voice object."""
-        return VoiceModel(
-            voice="Alan",
-            language="en_GB",
-            provider="piper",
-            option="medium",
-        )
-
     @pytest.fixture
     def piper_tmp(self, tmp_path: str) -> Piper:
         """Given a test, returns a Piper instance with a temp install directory."""
@@ -46,6 +61,88 @@ class TestPiper:
                 AudioData,
             ), "Audio data is not a valid AudioData object."
 
+        def test_concurrent_download(
+            self, piper_tmp: Piper, piper_model: VoiceModel
+        ) -> None:
+            """Given concurrent requests for a new model, it is downloaded once."""
+
+            def download(model_name: str) -> None:
+                time.sleep(0.05)  # Widen the window for a racing download
+                (Path(piper_tmp.install_dir) / f"{model_name}.onnx").touch()
+
+            voice = MagicMock()
+            voice.synthesize.return_value = []
+            with (
+                patch.object(piper_tmp, "download_voice", side_effect=download) as dl,
+                patch.object(piper_tmp, "load_voice", return_value=voice),
+                ThreadPoolExecutor(max_workers=4) as pool,
+            ):
+                list(
+                    pool.map(lambda _: piper_tmp.synthesise("Hi", piper_model), "abcd")
+                )
+            dl.assert_called_once()
+
+        def test_no_chunks(self, piper_tmp: Piper, piper_model: VoiceModel) -> None:
+            """Given Piper yields no audio chunks, returns empty audio data."""
+            voice = MagicMock()
+            voice.synthesize.return_value = []
+            voice.config.sample_rate = 22050
+            with (
+                patch.object(piper_tmp, "download_voice"),
+                patch.object(piper_tmp, "load_voice", return_value=voice),
+            ):
+                audio = piper_tmp.synthesise("...", piper_model)
+            assert audio.data == b""
+            assert audio.rate == 22050
+
+    class TestLoadVoice:
+        """Test suite for the load_voice() method in Piper."""
+
+        def test_voice_is_cached(self, piper_tmp: Piper) -> None:
+            """Given repeated calls for a model, the voice is only loaded once."""
+            model_path = Path(piper_tmp.install_dir) / "model.onnx"
+            with patch("piper.PiperVoice.load") as load:
+                first = piper_tmp.load_voice(model_path)
+                assert piper_tmp.load_voice(model_path) is first
+            load.assert_called_once_with(
+                model_path, config_path=f"{model_path}.json", use_cuda=False
+            )
+
+        def test_other_models_not_blocked(self, piper_tmp: Piper) -> None:
+            """Given one model is still loading, other models load without waiting."""
+            slow_path = Path(piper_tmp.install_dir) / "slow.onnx"
+            fast_path = Path(piper_tmp.install_dir) / "fast.onnx"
+            loading, release = threading.Event(), threading.Event()
+
+            def load(model_path: Path, **_: object) -> Path:
+                if model_path == slow_path:
+                    loading.set()
+                    assert release.wait(timeout=5), "Slow model was never released."
+                return model_path
+
+            with (
+                patch("piper.PiperVoice.load", side_effect=load),
+                ThreadPoolExecutor(max_workers=1) as pool,
+            ):
+                slow = pool.submit(piper_tmp.load_voice, slow_path)
+                assert loading.wait(timeout=5)
+                assert piper_tmp.load_voice(fast_path) == fast_path
+                assert not slow.done()
+                release.set()
+                assert slow.result() == slow_path
+
+        def test_quantized_voice(self, tmp_path: Path) -> None:
+            """Given quantize is set, the int8 model is loaded with the same config."""
+            instance = Piper(quantize=True)
+            model_path = tmp_path / "model.onnx"
+            quantized_path = tmp_path / "model.int8.onnx"
+            quantized_path.touch()
+            with patch("piper.PiperVoice.load") as load:
+                instance.load_voice(model_path)
+            load.assert_called_once_with(
+                quantized_path, config_path=f"{model_path}.json", use_cuda=False
+            )
+
     class TestDownloadVoiceModel:
         """Test suite for the download_voice() method in Piper."""
 
@@ -68,5 +165,54 @@ class TestPiper:
             """Given an invalid voice model ID, download_voice() raises an error."""
             model = piper_model
             model_name = f"{model.language}-{model.voice}_invalid-{model.option}"
-            with pytest.raises(ValueError, match="is not available"):
+            index = {"en_GB-alan-medium": {"name": "alan"}}
+            with (
+                patch.object(piper, "voices_index", return_value=index),
+                pytest.raises(ValueError, match="is not available"),
+            ):
                 piper_tmp.download_voice(model_name)
+
+
+class TestVoicesIndex:
+    """Test suite for the voices_index() function."""
+
+    INDEX = {"en_GB-alan-medium": {"name": "alan"}}  # NOQA: RUF012
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Generator[None]:
+        """Clear the in-process cache and point the cache at a temporary path."""
+        monkeypatch.setenv("OVP_CACHE_DIR", str(tmp_path))
+        piper.voices_index.cache_clear()
+        yield
+        piper.voices_index.cache_clear()
+
+    def test_fetched_once(self, tmp_path: Path) -> None:
+        """Given repeated calls, the index is only downloaded once."""
+        with patch.object(piper, "json_from_url", return_value=self.INDEX) as fetch:
+            assert piper.voices_index() == self.INDEX
+            assert piper.voices_index() == self.INDEX
+        fetch.assert_called_once()
+        assert (tmp_path / "piper" / "voices.json").is_file()
+
+    def test_disk_cache(self, tmp_path: Path) -> None:
+        """Given a recent copy on disk, the index is not downloaded."""
+        cache_file = tmp_path / "piper" / "voices.json"
+        cache_file.parent.mkdir()
+        cache_file.write_text(json.dumps(self.INDEX))
+        with patch.object(piper, "json_from_url") as fetch:
+            assert piper.voices_index() == self.INDEX
+        fetch.assert_not_called()
+
+    def test_expired_disk_cache(self, tmp_path: Path) -> None:
+        """Given an expired copy on disk, the index is downloaded again."""
+        cache_file = tmp_path / "piper" / "voices.json"
+        cache_file.parent.mkdir()
+        cache_file.write_text("{}")
+        expired = time.time() - piper.VOICES_TTL - 1
+        os.utime(cache_file, (expired, expired))
+        with patch.object(piper, "json_from_url", return_value=self.INDEX) as fetch:
+            assert piper.voices_index() == self.INDEX
+        fetch.assert_called_once()
+        assert json.loads(cache_file.read_text()) == self.INDEX
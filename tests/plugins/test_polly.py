@@ -4,17 +4,37 @@ Only tests that are specific to Polly should go here. Most provider tests should
 tests/providers/test_all.py to ensure consistency across all providers.
 
 Current tests:
-- AWS session handling.
+- AWS session handling and deferred credential checks.
 - Handling invalid SSML input.
+- Concurrent synthesis settings.
+- Choosing between SSML and plain text.
+- Caching synthesised audio on disk.
 """
 
-import boto3
-import botocore.exceptions
+import io
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from openvoicepacks.plugins import polly as polly_plugin
 from openvoicepacks.plugins.polly import Polly
 from openvoicepacks.voicemodel import VoiceModel
 
+# boto3 is imported by the tests that need it, so collecting this module stays cheap.
+if TYPE_CHECKING:
+    import boto3
+
+
+@pytest.fixture(scope="session")
+def boto_session() -> "boto3.session.Session":
+    """Return a default AWS session, shared so botocore loads its models once."""
+    import boto3  # NOQA: PLC0415
+
+    return boto3.Session()
+
 
 class TestPolly:
     """Test suite for the Polly TTS provider"""
@@ -32,16 +52,18 @@ class TestPolly:
     class TestSession:
         """Test suite for AWS session handling in Polly."""
 
-        def test_existing_session(self) -> None:
+        def test_existing_session(self, boto_session: "boto3.session.Session") -> None:
             """Given an existing AWS session, Polly client uses it."""
-            session = boto3.Session()
-            polly = Polly(session=session)
-            assert polly.session is session, (
+            polly = Polly(session=boto_session)
+            assert polly.session is boto_session, (
                 "Polly client did not use existing session."
             )
 
         def test_invalid_session(self) -> None:
             """Given invalid AWS credentials, an error is raised."""
+            import boto3  # NOQA: PLC0415
+            import botocore.exceptions  # NOQA: PLC0415
+
             session = boto3.session.Session(
                 aws_access_key_id="dummy",  # Require dummy credentials for testing
                 aws_secret_access_key="dummy",  # NOQA: S106
@@ -53,14 +75,164 @@ class TestPolly:
                     botocore.exceptions.ClientError,
                 ),
             ):
-                Polly(session=session)
+                Polly(session=session, verify_on_init=True)
+
+        def test_identity_deferred(self) -> None:
+            """Given a new instance, credentials are not checked until needed."""
+            session = MagicMock()
+            polly = Polly(session=session)
+            session.client.assert_called_once()  # Only the Polly client.
+            sts = session.client.return_value
+            sts.get_caller_identity.return_value = {"Arn": "arn:test"}
+            assert polly.verify_identity() == "arn:test"
+            assert polly.verify_identity() == "arn:test"
+            sts.get_caller_identity.assert_called_once()
+
+        def test_connection_pool(self) -> None:
+            """Given a session, the Polly client pool fits the concurrency limit."""
+            session = MagicMock()
+            Polly(session=session)
+            _, kwargs = session.client.call_args
+            assert kwargs["config"].max_pool_connections == Polly.max_concurrency
+
+        def test_client_config(self) -> None:
+            """Given client settings, both AWS clients are configured with them."""
+            session = MagicMock()
+            Polly(
+                session=session, connect_timeout=1, read_timeout=2, verify_on_init=True
+            )
+            assert session.client.call_count == 2
+            for call in session.client.call_args_list:
+                config = call.kwargs["config"]
+                assert config.connect_timeout == 1
+                assert config.read_timeout == 2
+                assert config.retries == {"max_attempts": 5, "mode": "adaptive"}
+                assert config.tcp_keepalive is True
+
+    class TestProcessMany:
+        """Test suite for the process_many() method in Polly."""
+
+        def test_workers_are_limited(self, polly_model: VoiceModel) -> None:
+            """Given too many workers, the concurrency limit is used instead."""
+            polly = Polly(session=MagicMock())
+            with patch("openvoicepacks.providers.process_queue") as process_queue:
+                polly.process_many([], polly_model, ".", max_workers=1000)
+            _, kwargs = process_queue.call_args
+            assert kwargs["workers"] == Polly.max_concurrency
+
+        def test_engine_concurrency(self, polly_model: VoiceModel) -> None:
+            """Given an engine with a lower quota, its concurrency limit is used."""
+            polly = Polly(session=MagicMock())
+            polly_model.option = "generative"
+            assert polly.concurrency(polly_model) == 8
+
+    class TestCache:
+        """Test suite for the on-disk audio cache in Polly."""
+
+        @pytest.fixture
+        def polly(self, tmp_path: Path) -> Polly:
+            """Return a Polly instance with a mock client and temporary cache."""
+            session = MagicMock()
+            session.client.return_value.synthesize_speech.side_effect = lambda **_: {
+                "AudioStream": io.BytesIO(b"\x01\x02")
+            }
+            return Polly(session=session, cache_dir=tmp_path)
+
+        def test_cache_hit(self, polly: Polly, polly_model: VoiceModel) -> None:
+            """Given a phrase synthesised before, the cached audio is returned."""
+            first = polly.synthesise("Hello", polly_model)
+            second = polly.synthesise("Hello", polly_model)
+            assert second == first
+            polly._client.synthesize_speech.assert_called_once()
+            polly._client.get_caller_identity.assert_called_once()
+
+        def test_cache_miss(self, polly: Polly, polly_model: VoiceModel) -> None:
+            """Given different phrases, each is synthesised."""
+            polly.synthesise("Hello", polly_model)
+            polly.synthesise("Goodbye", polly_model)
+            assert polly._client.synthesize_speech.call_count == 2
+
+        def test_cache_shared(
+            self, polly: Polly, polly_model: VoiceModel, tmp_path: Path
+        ) -> None:
+            """Given a new instance using the same cache, the cached audio is used."""
+            polly.synthesise("Hello", polly_model)
+            other = Polly(session=MagicMock(), cache_dir=tmp_path)
+            assert other.synthesise("Hello", polly_model).data == b"\x01\x02"
+            other._client.synthesize_speech.assert_not_called()
+            other._client.get_caller_identity.assert_not_called()
+
+        def test_voice_parameters(self, polly: Polly, polly_model: VoiceModel) -> None:
+            """Given a voice model, Polly is sent its voice ID and language code."""
+            polly_model.language = "en_US"
+            polly.synthesise("Hello", polly_model)
+            _, kwargs = polly._client.synthesize_speech.call_args
+            assert kwargs["VoiceId"] == "Amy"
+            assert kwargs["LanguageCode"] == "en-US"
+
+        def test_output_format(self, polly: Polly, polly_model: VoiceModel) -> None:
+            """Given an output format in the model extras, Polly is asked for it."""
+            polly_model.extras = {"output_format": "mp3"}
+            audio = polly.synthesise("Hello", polly_model)
+            _, kwargs = polly._client.synthesize_speech.call_args
+            assert kwargs["OutputFormat"] == "mp3"
+            assert audio.format == "mp3"
+            assert polly.synthesise("Hello", polly_model).format == "mp3"
+            polly._client.synthesize_speech.assert_called_once()
+
+        def test_prune_cache(self, tmp_path: Path) -> None:
+            """Given a cache larger than cache_size, the oldest audio is removed."""
+            for age, name in enumerate(["new", "old"]):
+                audio_file = tmp_path / f"{name}.audio"
+                audio_file.write_bytes(b"\x00" * 10)
+                audio_file.with_suffix(".json").write_text('{"rate": 16000}')
+                os.utime(audio_file, (1000 - age, 1000 - age))
+            Polly(session=MagicMock(), cache_dir=tmp_path, cache_size=15)
+            assert (tmp_path / "new.audio").exists()
+            assert not (tmp_path / "old.audio").exists()
+            assert not (tmp_path / "old.json").exists()
+
+    class TestSSML:
+        """Test suite for the text sent to Polly."""
+
+        def test_wrapped_ssml(self) -> None:
+            """Given text already wrapped in <speak>, it is sent unchanged."""
+            text = "<speak>Hello</speak>"
+            assert polly_plugin._ssml(text, add_break=True) == ("ssml", text)
+
+        def test_add_break(self) -> None:
+            """Given a break is wanted, text is wrapped with a trailing break."""
+            assert polly_plugin._ssml("Hello", add_break=True) == (
+                "ssml",
+                '<speak>Hello<break strength="weak"/></speak>',
+            )
+
+        def test_plain_text(self) -> None:
+            """Given plain text and no break, it is sent as plain text."""
+            assert polly_plugin._ssml("Hello", add_break=False) == ("text", "Hello")
+
+        def test_tagged_text(self) -> None:
+            """Given text with SSML tags and no break, it is wrapped in <speak>."""
+            text = '<emphasis level="strong">Hello</emphasis>'
+            assert polly_plugin._ssml(text, add_break=False) == (
+                "ssml",
+                f"<speak>{text}</speak>",
+            )
+
+        def test_comparison_is_plain_text(self) -> None:
+            """Given text with a less than symbol, it is not treated as SSML."""
+            assert polly_plugin._ssml("1 < 2", add_break=False) == ("text", "1 < 2")
 
     class TestSynthesise:
         """Test suite for the synthesise() method in Polly."""
 
-        def test_invalid_string(self, polly_model: VoiceModel) -> None:
+        def test_invalid_string(
+            self, polly_model: VoiceModel, boto_session: "boto3.session.Session"
+        ) -> None:
             """Given an invalid string, synthesise raises an error."""
-            instance = Polly()
+            import botocore.exceptions  # NOQA: PLC0415
+
+            instance = Polly(session=boto_session)
             with pytest.raises(
                 (botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError),
             ):
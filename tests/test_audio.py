@@ -2,30 +2,47 @@
 
 Current tests:
 - Initialization of AudioData objects.
-- Writing audio data to WAV files.
+- Writing audio data to WAV files and file-like objects.
+- Filtering out frequencies that would alias when downsampling.
 """
 
+import array
+import io
+import math
+import wave
+from dataclasses import FrozenInstanceError
 from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
 
+import audioop
 import magic
 import pytest
 
 from openvoicepacks.audio import AudioData, SoundFile
 
-WAV_CONFIG = {
-    "data": b"00",
-    "rate": 16000,
-    "width": 2,
-    "channels": 1,
-}
+WAV_CONFIG = MappingProxyType(
+    {
+        "data": b"00",
+        "rate": 16000,
+        "width": 2,
+        "channels": 1,
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def mime() -> magic.Magic:
+    """Return a MIME type detector, loading the libmagic database once."""
+    return magic.Magic(mime=True)
 
 
 class TestAudioData:
     """Test suite for the AudioData class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def audio_data(self) -> AudioData:
-        """Return a sample AudioData object."""
+        """Return a sample AudioData object, shared as AudioData is immutable."""
         return AudioData(
             data=WAV_CONFIG["data"],
             rate=WAV_CONFIG["rate"],
@@ -50,37 +67,133 @@ class TestAudioData:
                 "Channels does not match."
             )
 
+        def test_immutable(self, audio_data: AudioData) -> None:
+            """Given an AudioData object, its fields cannot be changed."""
+            with pytest.raises(FrozenInstanceError):
+                audio_data.rate = 8000
+            assert not hasattr(audio_data, "__dict__")
+
     class TestWriteWav:
         """Test suite for the write_wav method in AudioData."""
 
         def test_sound_data_is_valid(
-            self, audio_data: AudioData, tmp_file: Path
+            self, audio_data: AudioData, tmp_file: Path, mime: magic.Magic
         ) -> None:
             """Given audio data, when written to a WAV file, then the file is valid."""
             audio_data.write_wav(tmp_file)
             assert tmp_file.exists(), "WAV file was not created successfully."
-            mime = magic.Magic(mime=True)
             assert mime.from_file(tmp_file) == "audio/x-wav", "WAV file is not valid."
 
+        def test_write_pcm_frames(self, tmp_file: Path) -> None:
+            """Given matching rates, the PCM frames are written unchanged."""
+            audio_data = AudioData(data=b"\x01\x00\x02\x00\x03\x00", rate=22050)
+            assert audio_data.write_wav(tmp_file, output_rate=22050) == tmp_file
+            with wave.open(str(tmp_file), "rb") as wav:
+                assert wav.getframerate() == 22050
+                assert wav.getsampwidth() == 2
+                assert wav.getnchannels() == 1
+                assert wav.readframes(wav.getnframes()) == audio_data.data
+
+        def test_memoryview_data(self, tmp_file: Path) -> None:
+            """Given audio data in a memoryview, the frames are written unchanged."""
+            frames = array.array("h", [1, 2, 3])
+            audio_data = AudioData(data=memoryview(frames).cast("B"))
+            audio_data.write_wav(tmp_file)
+            with wave.open(str(tmp_file), "rb") as wav:
+                assert wav.readframes(wav.getnframes()) == frames.tobytes()
+
+        def test_resample(self, tmp_file: Path) -> None:
+            """Given a different output rate, the audio is resampled."""
+            audio_data = AudioData(data=b"\x00\x01" * 22050, rate=22050)
+            audio_data.write_wav(tmp_file, output_rate=16000)
+            with wave.open(str(tmp_file), "rb") as wav:
+                assert wav.getframerate() == 16000
+                assert wav.getnframes() == pytest.approx(16000, abs=1)
+
+        @pytest.mark.parametrize(
+            ("frequency", "kept"),
+            [
+                (1000, True),  # Below the 8 kHz output Nyquist frequency
+                (10000, False),  # Would alias to 6 kHz without a low-pass filter
+            ],
+        )
+        def test_resample_anti_alias(self, frequency: int, kept: bool) -> None:  # NOQA: FBT001
+            """Given downsampling, only frequencies the output rate can hold remain."""
+            tone = array.array(
+                "h",
+                (
+                    int(16000 * math.sin(2 * math.pi * frequency * n / 22050))
+                    for n in range(22050)
+                ),
+            )
+            buffer = io.BytesIO()
+            AudioData(data=tone.tobytes(), rate=22050).write_wav(buffer)
+            buffer.seek(0)
+            with wave.open(buffer, "rb") as wav:
+                frames = wav.readframes(wav.getnframes())
+            ratio = audioop.rms(frames, 2) / audioop.rms(tone.tobytes(), 2)
+            assert ratio > 0.9 if kept else ratio < 0.05
+
+        def test_file_object(self) -> None:
+            """Given a binary file-like object, the WAVE data is written to it."""
+            audio_data = AudioData(data=b"\x01\x00\x02\x00")
+            buffer = io.BytesIO()
+            assert audio_data.write_wav(buffer) is buffer
+            assert buffer.getvalue() == audio_data.to_wav_bytes()
+
+        @pytest.mark.parametrize("bad_rate", [0, -1, 1.5, "16000", None])
         def test_invalid_output_rate(
-            self, audio_data: AudioData, tmp_file: Path
+            self, audio_data: AudioData, tmp_file: Path, bad_rate: object
         ) -> None:
             """Given audio data with an invalid output rate, ValueError is raised."""
-            for bad_rate in [0, -1, 1.5, "16000", None]:
-                with pytest.raises(
-                    ValueError, match="output_rate must be a positive integer"
-                ):
-                    audio_data.write_wav(tmp_file, output_rate=bad_rate)
+            with pytest.raises(
+                ValueError, match="output_rate must be a positive integer"
+            ):
+                audio_data.write_wav(tmp_file, output_rate=bad_rate)
+
+    class TestPCM:
+        """Test suite for the pcm method in AudioData."""
+
+        def test_pcm_unchanged(self, audio_data: AudioData) -> None:
+            """Given PCM audio data, the same object is returned."""
+            assert audio_data.pcm() is audio_data
+
+        def test_compressed_decoded(self) -> None:
+            """Given compressed audio data, it is decoded to PCM with pydub."""
+            audio_data = AudioData(data=b"OggS", rate=16000, format="ogg_vorbis")
+            sound = MagicMock(
+                raw_data=b"\x01\x00", frame_rate=22050, sample_width=2, channels=1
+            )
+            with patch("pydub.AudioSegment.from_file", return_value=sound) as decode:
+                pcm = audio_data.pcm()
+            assert decode.call_args.kwargs["format"] == "ogg"
+            assert pcm == AudioData(data=b"\x01\x00", rate=22050)
+
+    class TestToWavBytes:
+        """Test suite for the to_wav_bytes method in AudioData."""
+
+        def test_wav_bytes(self, audio_data: AudioData) -> None:
+            """Given audio data, WAVE bytes containing the frames are returned."""
+            data = audio_data.to_wav_bytes()
+            assert data.startswith(b"RIFF")
+            with wave.open(io.BytesIO(data), "rb") as wav:
+                assert wav.getframerate() == audio_data.rate
+                assert wav.readframes(wav.getnframes()) == audio_data.data
+
+        def test_invalid_output_rate(self, audio_data: AudioData) -> None:
+            """Given an invalid output rate, ValueError is raised."""
+            with pytest.raises(
+                ValueError, match="output_rate must be a positive integer"
+            ):
+                audio_data.to_wav_bytes(output_rate=0)
 
 
 class TestSoundFile:
     """Tests for the SoundFile class."""
 
-    class DummyAudio:
-        """Dummy audio class for testing."""
-
-    class DummyVoiceModel:
-        """Dummy voice model class for testing."""
+    # Stand-ins for audio and a voice model, SoundFile only stores them.
+    AUDIO = object()
+    VOICEMODEL = object()
 
     def test_basic_initialisation(self) -> None:
         """Given path and text, SoundFile initializes correctly."""
@@ -93,15 +206,16 @@ class TestSoundFile:
 
     def test_initialisation_with_kwargs(self) -> None:
         """Given path, text, audio, and voicemodel, SoundFile initializes correctly."""
-        audio = self.DummyAudio()
-        voicemodel = self.DummyVoiceModel()
         sf = SoundFile(
-            path="farewell", text="goodbye", audio=audio, voicemodel=voicemodel
+            path="farewell",
+            text="goodbye",
+            audio=self.AUDIO,
+            voicemodel=self.VOICEMODEL,
         )
         assert sf.path == "farewell"
         assert sf.text == "goodbye"
-        assert sf.audio is audio
-        assert sf.voicemodel is voicemodel
+        assert sf.audio is self.AUDIO
+        assert sf.voicemodel is self.VOICEMODEL
         assert repr(sf) == "<SoundFile path='farewell' text='goodbye' audio=yes>"
 
     def test_repr_audio_absent(self) -> None:
@@ -111,5 +225,5 @@ class TestSoundFile:
 
     def test_repr_audio_present(self) -> None:
         """Given audio present, __repr__ indicates audio is present."""
-        sf = SoundFile(path="test", text="something", audio=object())
+        sf = SoundFile(path="test", text="something", audio=self.AUDIO)
         assert "audio=yes" in repr(sf)
@@ -1,8 +1,27 @@
 """Tests for CLI client."""
 
+import re
+import zipfile
+from collections.abc import Generator
+from pathlib import Path
+from textwrap import dedent
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
 from click.testing import CliRunner
 
-from openvoicepacks.client import ovp
+from openvoicepacks.audio import AudioData
+from openvoicepacks.client import LazyChoice, LazyGroup, ovp
+from openvoicepacks.providers import Provider
+
+_HAS_DIGIT = re.compile(r"\d").search
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Return a CLI runner shared by the tests in the module."""
+    return CliRunner()
 
 
 class TestOVP:
@@ -11,33 +30,162 @@ class TestOVP:
     class TestHelp:
         """Test suite for the OVP CLI help commands."""
 
-        def test_ovp_group_help(self) -> None:
+        def test_ovp_group_help(self, runner: CliRunner) -> None:
             """Given the ovp command, when --help is invoked, help message is shown."""
-            runner = CliRunner()
             result = runner.invoke(ovp, ["--help"])
             assert result.exit_code == 0
             assert "OpenVoicePacks command line interface" in result.output
 
+        def test_ovp_group_lists_commands(self, runner: CliRunner) -> None:
+            """Given the ovp command, --help lists the lazily loaded subcommands."""
+            result = runner.invoke(ovp, ["--help"])
+            assert result.exit_code == 0
+            for command in ("build", "check", "init", "merge", "providers", "version"):
+                assert command in result.output
+
     class TestVersion:
         """Test suite for the OVP CLI version commands."""
 
-        def test_version_command_default(self) -> None:
+        def test_version_command_default(self, runner: CliRunner) -> None:
             """Given the ovp version command, version info is shown."""
-            runner = CliRunner()
             result = runner.invoke(ovp, ["version"])
             assert result.exit_code == 0
             # Should show name and version
             assert (
                 "OpenVoicePacks" in result.output or "openvoicepacks" in result.output
             )
-            assert any(char.isdigit() for char in result.output)
+            assert _HAS_DIGIT(result.output)
 
-        def test_version_command_short(self) -> None:
+        def test_version_command_short(self, runner: CliRunner) -> None:
             """Given the ovp version command with --short, short version is shown."""
-            runner = CliRunner()
             result = runner.invoke(ovp, ["version", "--short"])
             assert result.exit_code == 0
             # Should only show version string
-            assert result.output.strip().replace(".", "").isdigit() or any(
-                char.isdigit() for char in result.output
+            assert _HAS_DIGIT(result.output)
+
+    class TestBuild:
+        """Test suite for the OVP CLI build command."""
+
+        @pytest.fixture
+        def voicepack_file(self, tmp_path: Path) -> Path:
+            """Return a voice pack config using the generic provider."""
+            path = tmp_path / "test.yaml"
+            path.write_text(
+                dedent("""
+                    name: Test Pack
+                    model:
+                      provider: generic
+                      voice: test
+                      language: en_GB
+                    sounds:
+                      hello: Hello
+                      system:
+                        goodbye: Goodbye
+                """)
+            )
+            return path
+
+        @pytest.fixture(autouse=True)
+        def synthesise(self) -> Generator[MagicMock]:
+            """Patch the generic provider to return silent audio."""
+            with patch.object(
+                Provider, "_synthesise", return_value=AudioData(data=b"\x00\x00")
+            ) as mock:
+                yield mock
+
+        def test_dry_run(
+            self, runner: CliRunner, voicepack_file: Path, synthesise: MagicMock
+        ) -> None:
+            """Given --dry-run, sounds are listed but not synthesised."""
+            result = runner.invoke(ovp, ["build", str(voicepack_file), "-d"])
+            assert result.exit_code == 0, result.output
+            assert "SYSTEM/goodbye.wav: Goodbye" in result.output
+            synthesise.assert_not_called()
+
+        def test_directory(
+            self, runner: CliRunner, voicepack_file: Path, tmp_path: Path
+        ) -> None:
+            """Given no --zip, WAV files are written to a directory."""
+            output = tmp_path / "out"
+            result = runner.invoke(
+                ovp, ["build", str(voicepack_file), "-o", str(output)]
             )
+            assert result.exit_code == 0, result.output
+            assert (output / "test_pack" / "hello.wav").is_file()
+            assert (output / "test_pack" / "SYSTEM" / "goodbye.wav").is_file()
+
+        def test_zip(
+            self, runner: CliRunner, voicepack_file: Path, tmp_path: Path
+        ) -> None:
+            """Given --zip, WAV files are written into an uncompressed archive."""
+            result = runner.invoke(
+                ovp, ["build", str(voicepack_file), "-o", str(tmp_path), "--zip"]
+            )
+            assert result.exit_code == 0, result.output
+            with zipfile.ZipFile(tmp_path / "test_pack.zip") as archive:
+                assert sorted(archive.namelist()) == ["SYSTEM/goodbye.wav", "hello.wav"]
+                info = archive.getinfo("hello.wav")
+                assert info.compress_type == zipfile.ZIP_STORED
+                assert archive.read("hello.wav").startswith(b"RIFF")
+
+        def test_failures(
+            self,
+            runner: CliRunner,
+            voicepack_file: Path,
+            tmp_path: Path,
+            synthesise: MagicMock,
+        ) -> None:
+            """Given sounds fail to synthesise, the command fails."""
+            synthesise.side_effect = RuntimeError("Synthesis failed")
+            result = runner.invoke(
+                ovp, ["build", str(voicepack_file), "-o", str(tmp_path)]
+            )
+            assert result.exit_code == 1
+            assert "Failed to build 2 of 2 sounds" in result.output
+
+
+class TestLazyGroup:
+    """Test suite for the LazyGroup click group."""
+
+    def test_get_command(self) -> None:
+        """Given a lazy subcommand, get_command() imports and returns it."""
+        group = LazyGroup(
+            lazy_subcommands={"version": ("openvoicepacks.cli.version", "version")}
+        )
+        ctx = click.Context(group)
+        assert group.list_commands(ctx) == ["version"]
+        assert isinstance(group.get_command(ctx, "version"), click.Command)
+        assert group.get_command(ctx, "unknown") is None
+
+    def test_invalid_command(self) -> None:
+        """Given a lazy subcommand that is not a click command, TypeError is raised."""
+        group = LazyGroup(
+            lazy_subcommands={"bad": ("openvoicepacks.utils", "metadata")}
+        )
+        with pytest.raises(TypeError, match="is not a click command"):
+            group.get_command(click.Context(group), "bad")
+
+
+class TestLazyChoice:
+    """Tests for the LazyChoice parameter type."""
+
+    def test_choices_are_deferred(self) -> None:
+        """Given a LazyChoice, the factory is only called once choices are needed."""
+        factory = MagicMock(return_value=["one", "two"])
+        choice = LazyChoice(factory, case_sensitive=False)
+        factory.assert_not_called()
+        assert choice.convert("ONE", None, None) == "one"
+        assert choice.choices == ("one", "two")
+        factory.assert_called_once()
+
+    def test_invalid_choice(self) -> None:
+        """Given a value that is not a choice, the conversion fails."""
+        choice = LazyChoice(lambda: ["one"])
+        with pytest.raises(click.BadParameter):
+            choice.convert("three", None, None)
+
+    def test_choice_attributes(self) -> None:
+        """Given a LazyChoice, click.Choice sets up its usual attributes."""
+        choice = LazyChoice(lambda: ["one", "two"], case_sensitive=False)
+        assert not choice.case_sensitive
+        assert choice.to_info_dict()["choices"] == ("one", "two")
@@ -0,0 +1,102 @@
+"""Unit tests for plugin discovery in openvoicepacks.plugin_registry.
+
+Current tests:
+- Discovery of plugins through entry points, without importing them.
+- Lazy loading of plugins through get_providers() and the providers attribute.
+- Rejection of plugins without a PROVIDER, or one named unlike their entry point.
+- Lookup of provider classes by name.
+"""
+
+from importlib.metadata import EntryPoint
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from openvoicepacks import plugin_registry
+from openvoicepacks.providers import Provider
+
+
+class TestDiscoverPlugins:
+    """Tests for the discover_plugins() function."""
+
+    def test_bundled_plugins(self) -> None:
+        """Given the bundled plugins, their entry points are discovered."""
+        plugins = plugin_registry.discover_plugins()
+        assert {"piper", "polly"} <= set(plugins)
+        assert all(isinstance(ep, EntryPoint) for ep in plugins.values())
+
+    def test_provider_names(self) -> None:
+        """Given the bundled plugins, provider names are listed in sorted order."""
+        names = plugin_registry.provider_names()
+        assert names == sorted(names)
+        assert {"piper", "polly"} <= set(names)
+
+
+class TestGetProviders:
+    """Tests for the get_providers() function."""
+
+    def test_bundled_providers(self) -> None:
+        """Given the bundled plugins, the piper and polly providers are registered."""
+        providers = plugin_registry.get_providers()
+        assert {"piper", "polly"} <= set(providers)
+        assert all(issubclass(p, Provider) for p in providers.values())
+
+    def test_providers_attribute(self) -> None:
+        """Given the providers module attribute, the registry is returned."""
+        assert plugin_registry.providers is plugin_registry.get_providers()
+
+    def test_unknown_attribute(self) -> None:
+        """Given an unknown module attribute, AttributeError is raised."""
+        with pytest.raises(AttributeError, match="has no attribute"):
+            _ = plugin_registry.unknown
+
+
+class TestLoadProvider:
+    """Tests for the load_provider() function."""
+
+    @pytest.fixture
+    def plugin(self, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+        """Return an empty plugin module, installed under the name "test"."""
+        module = ModuleType("test_plugin")
+        entry_point = SimpleNamespace(load=lambda: module)
+        monkeypatch.setattr(
+            plugin_registry, "discover_plugins", lambda: {"test": entry_point}
+        )
+        monkeypatch.setattr(plugin_registry, "_providers", {})
+        return module
+
+    def test_provider(self, plugin: ModuleType) -> None:
+        """Given a plugin with a matching PROVIDER, its class is returned."""
+        plugin.PROVIDER = type("TestProvider", (Provider,), {"provider": "test"})
+        assert plugin_registry.load_provider("test") is plugin.PROVIDER
+
+    @pytest.mark.usefixtures("plugin")
+    def test_missing_provider(self) -> None:
+        """Given a plugin without a PROVIDER, ValueError names the plugin."""
+        with pytest.raises(ValueError, match='"test_plugin" has no PROVIDER'):
+            plugin_registry.load_provider("test")
+
+    def test_mismatched_name(self, plugin: ModuleType) -> None:
+        """Given a PROVIDER named unlike its entry point, ValueError is raised."""
+        plugin.PROVIDER = type("OtherProvider", (Provider,), {"provider": "other"})
+        with pytest.raises(ValueError, match='"test_plugin" provides "other"'):
+            plugin_registry.load_provider("test")
+        assert "other" not in plugin_registry._providers
+
+
+class TestGetProviderClass:
+    """Tests for the get_provider_class() function."""
+
+    def test_generic(self) -> None:
+        """Given the generic provider name, the Provider base class is returned."""
+        assert plugin_registry.get_provider_class("generic") is Provider
+
+    def test_case_insensitive(self) -> None:
+        """Given a provider name in any case, the provider class is returned."""
+        provider_class = plugin_registry.get_provider_class("Piper")
+        assert provider_class.provider == "piper"
+
+    def test_unknown(self) -> None:
+        """Given an unknown provider name, ValueError is raised."""
+        with pytest.raises(ValueError, match="Unknown provider: test"):
+            plugin_registry.get_provider_class("test")
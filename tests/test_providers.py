@@ -9,19 +9,19 @@ Current tests:
 - Ensuring unimplemented methods raise NotImplementedError.
 """
 
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
+from openvoicepacks.audio import AudioData, SoundFile
 from openvoicepacks.providers import Provider
 from openvoicepacks.voicemodel import VoiceModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generic_model() -> VoiceModel:
-    """Return a valid VoiceModel for testing."""
+    """Return a valid VoiceModel for testing, shared by the module so do not modify."""
     return VoiceModel(
         voice="test", language="en_GB", provider="generic", option="standard"
     )
@@ -105,17 +105,43 @@ class TestProviderAttributes:
 class TestProviderProcess:
     """Tests for the process method of Provider."""
 
-    def test_process_calls_write_wav(self, generic_model: VoiceModel) -> None:
+    def test_process_calls_write_wav(
+        self, generic_model: VoiceModel, tmp_path: Path
+    ) -> None:
         """Given a call to process(), synthesise() is called and write_wav() is used."""
         p = Provider()
         # Patch synthesise to return a mock AudioData with a write_wav method
         mock_audio = MagicMock()
         p.synthesise = MagicMock(return_value=mock_audio)
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            tmp_path = tmp.name
-        try:
-            p.process(tmp_path, "text", generic_model)
-            p.synthesise.assert_called_once_with("text", generic_model)
-            mock_audio.write_wav.assert_called_once_with(tmp_path)
-        finally:
-            Path.unlink(tmp_path)
+        out_path = tmp_path / "out.wav"
+        p.process(out_path, "text", generic_model)
+        p.synthesise.assert_called_once_with("text", generic_model)
+        mock_audio.write_wav.assert_called_once_with(out_path)
+
+
+class TestProviderProcessMany:
+    """Tests for the process_many method of Provider."""
+
+    def test_process_many(self, generic_model: VoiceModel, tmp_path: Path) -> None:
+        """Given sound files, each is written to a WAV file in the directory."""
+        p = Provider()
+        p._synthesise = MagicMock(return_value=AudioData(data=b"\x00\x00"))
+        sound_files = [
+            SoundFile(path="hello", text="Hello"),
+            SoundFile(path="SYSTEM/goodbye", text="Goodbye"),
+        ]
+        assert p.process_many(sound_files, generic_model, tmp_path) == []
+        assert (tmp_path / "hello.wav").is_file()
+        assert (tmp_path / "SYSTEM" / "goodbye.wav").is_file()
+        assert p._synthesise.call_count == len(sound_files)
+
+    def test_failures_are_returned(
+        self, generic_model: VoiceModel, tmp_path: Path
+    ) -> None:
+        """Given a sound file that fails to synthesise, it is returned."""
+        bad = SoundFile(path="bad", text="")
+        good = SoundFile(path="good", text="Good")
+        p = Provider()
+        p._synthesise = MagicMock(return_value=AudioData(data=b"\x00\x00"))
+        assert p.process_many([bad, good], generic_model, tmp_path) == [bad]
+        assert (tmp_path / "good.wav").is_file()
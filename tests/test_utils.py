@@ -4,27 +4,178 @@ Current tests:
 - voicepack_from_csv: Check valid CSV and missing required fields.
 - voicepack_from_yaml: Check valid YAML conversion.
 - json_from_url: Check valid URL, invalid URL, and non-JSON response.
-- validate_file_path: Check valid path, non-existent or non-writable directory,
-  empty string, invalid type.
+- validate_file_path: Check valid path, non-existent, non-writable or inaccessible
+  directory, a file as the parent, owned directory without an access check, empty
+  string, invalid type.
 """
 
 import io
 import json
+import logging
+import os
+import stat
+from collections.abc import Callable, Generator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
+from urllib.error import URLError
 
 import pytest
 
+from openvoicepacks import utils
 from openvoicepacks.utils import (
     json_from_url,
     validate_file_path,
 )
 
 
+class TestMetadata:
+    """Tests for package metadata."""
+
+    def test_metadata(self) -> None:
+        """Given the installed package, metadata includes name, version and URLs."""
+        assert utils.metadata["name"] == "openvoicepacks"
+        assert utils.metadata["version"]
+        assert "homepage" in utils.metadata["url"]
+
+    def test_metadata_cached(self) -> None:
+        """Given repeated loads, package metadata is only parsed once."""
+        assert utils._load_metadata() is utils._load_metadata()
+        assert utils.metadata is utils._load_metadata()
+
+    def test_unknown_attribute(self) -> None:
+        """Given an unknown module attribute, AttributeError is raised."""
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            utils.missing  # NOQA: B018
+
+
+class TestConfigureLogging:
+    """Tests for configure_logging utility."""
+
+    @pytest.fixture(autouse=True)
+    def restore_root_level(self) -> Generator[None]:
+        """Restore the root logger level after each test."""
+        level = logging.root.level
+        yield
+        logging.root.setLevel(level)
+
+    @pytest.fixture
+    def no_handlers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Report the root logger as having no handlers."""
+        monkeypatch.setattr(logging.root, "hasHandlers", lambda: False)
+
+    @pytest.fixture
+    def tty(self, monkeypatch: pytest.MonkeyPatch) -> Callable[[bool], None]:
+        """Return a function for setting whether stderr is a terminal."""
+
+        def set_tty(isatty: bool) -> None:  # NOQA: FBT001
+            monkeypatch.setattr(utils.sys.stderr, "isatty", lambda: isatty)
+
+        return set_tty
+
+    def test_level_argument(self) -> None:
+        """Given a log level, the root logger is configured at that level."""
+        utils.configure_logging("debug")
+        assert logging.root.level == logging.DEBUG
+
+    def test_level_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Given OVP_LOG_LEVEL is set, the root logger is configured at that level."""
+        monkeypatch.setenv("OVP_LOG_LEVEL", "warning")
+        utils.configure_logging()
+        assert logging.root.level == logging.WARNING
+
+    def test_existing_handlers(self) -> None:
+        """Given the root logger has handlers, no handlers are added."""
+        handlers = logging.root.handlers[:]
+        utils.configure_logging()
+        assert logging.root.handlers == handlers
+
+    @pytest.mark.usefixtures("no_handlers")
+    def test_plain_output(self, tty: Callable[[bool], None]) -> None:
+        """Given stderr is not a terminal, plain log output is configured."""
+        tty(False)  # NOQA: FBT003
+        with (
+            patch("coloredlogs.install") as install,
+            patch("logging.basicConfig") as basic_config,
+        ):
+            utils.configure_logging("debug")
+        install.assert_not_called()
+        basic_config.assert_called_once_with(level="DEBUG", format=utils._LOGFORMAT)
+
+    @pytest.mark.usefixtures("no_handlers")
+    def test_coloured_output(self, tty: Callable[[bool], None]) -> None:
+        """Given stderr is a terminal, coloured log output is configured."""
+        tty(True)  # NOQA: FBT003
+        with (
+            patch("coloredlogs.install") as install,
+            patch("logging.basicConfig") as basic_config,
+        ):
+            utils.configure_logging("debug")
+        install.assert_called_once_with(level="DEBUG", fmt=utils._LOGFORMAT)
+        basic_config.assert_not_called()
+
+
+class TestCacheDir:
+    """Tests for cache_dir utility."""
+
+    def test_ovp_cache_dir(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Given OVP_CACHE_DIR is set, the cache is located there."""
+        monkeypatch.setenv("OVP_CACHE_DIR", str(tmp_path))
+        assert utils.cache_dir() == tmp_path
+        assert utils.cache_dir("jinja") == tmp_path / "jinja"
+
+    def test_xdg_cache_home(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Given XDG_CACHE_HOME is set, the cache is located within it."""
+        monkeypatch.delenv("OVP_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert utils.cache_dir("jinja") == tmp_path / "openvoicepacks" / "jinja"
+
+    def test_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Given no environment variables, the cache is located in ~/.cache."""
+        monkeypatch.delenv("OVP_CACHE_DIR", raising=False)
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        assert utils.cache_dir() == Path.home() / ".cache" / "openvoicepacks"
+
+
+class TestGetTemplateEnv:
+    """Tests for get_template_env utility."""
+
+    def test_environment_cached(self) -> None:
+        """Given repeated calls, the same template environment is returned."""
+        assert utils.get_template_env() is utils.get_template_env()
+
+    def test_metadata_global(self) -> None:
+        """Given the template environment, package metadata is available globally."""
+        assert utils.get_template_env().globals["metadata"] is utils.metadata
+
+    def test_bytecode_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Given a new environment, compiled templates are written to the cache."""
+        monkeypatch.setenv("OVP_CACHE_DIR", str(tmp_path))
+        env = utils.get_template_env()
+        assert env.bytecode_cache is not None
+        assert list((tmp_path / "jinja").iterdir())
+
+
 class TestJsonFromUrl:
     """Tests for json_from_url utility."""
 
-    @patch("openvoicepacks.utils.urlopen")
+    @pytest.fixture(autouse=True)
+    def mock_urlopen(self) -> Generator[MagicMock]:
+        """Patch urlopen for every test, so none of them reach the network."""
+        with patch("openvoicepacks.utils.urlopen") as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_sleep(self) -> Generator[MagicMock]:
+        """Patch the delay between retries."""
+        with patch("openvoicepacks.utils.time.sleep") as mock:
+            yield mock
+
     def test_valid_json(self, mock_urlopen: MagicMock) -> None:
         """Given a valid URL, returns parsed JSON."""
         mock_response = io.BytesIO(json.dumps({"foo": "bar"}).encode())
@@ -32,14 +183,39 @@ class TestJsonFromUrl:
         result = json_from_url("http://example.com/data.json")
         assert result == {"foo": "bar"}
 
-    @patch("openvoicepacks.utils.urlopen")
     def test_invalid_url(self, mock_urlopen: MagicMock) -> None:
         """Given an invalid URL, raises ValueError."""
         mock_urlopen.side_effect = Exception("Network error")
         with pytest.raises(Exception, match="Network error"):
             json_from_url("http://bad-url")
 
-    @patch("openvoicepacks.utils.urlopen")
+    def test_retry(self, mock_urlopen: MagicMock, mock_sleep: MagicMock) -> None:
+        """Given a connection error, the request is retried."""
+        mock_response = io.BytesIO(b"[1]")
+        mock_urlopen.side_effect = [
+            URLError("Connection refused"),
+            MagicMock(__enter__=MagicMock(return_value=mock_response)),
+        ]
+        assert json_from_url("http://example.com/data.json") == [1]
+        assert mock_urlopen.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_retries_exhausted(
+        self, mock_urlopen: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Given repeated connection errors, the last error is raised."""
+        mock_urlopen.side_effect = URLError("Connection refused")
+        with pytest.raises(URLError):
+            json_from_url("http://example.com/data.json")
+        assert mock_urlopen.call_count == utils.URL_ATTEMPTS
+        assert mock_sleep.call_count == utils.URL_ATTEMPTS - 1
+
+    def test_invalid_scheme(self, mock_urlopen: MagicMock) -> None:
+        """Given a URL which is not http or https, raises ValueError."""
+        with pytest.raises(ValueError, match="URL must start with"):
+            json_from_url("file:///etc/passwd")
+        mock_urlopen.assert_not_called()
+
     def test_non_json_response(self, mock_urlopen: MagicMock) -> None:
         """Given a URL returning non-JSON, raises ValueError."""
         mock_response = io.BytesIO(b"not json")
@@ -51,9 +227,13 @@ class TestJsonFromUrl:
 class TestValidateFilePath:
     """Tests for validate_file_path utility."""
 
-    def test_valid_path(self, tmp_path: Path) -> None:
+    @pytest.fixture
+    def file_path(self, tmp_path: Path) -> Path:
+        """Return a path to a file in a writable temporary directory."""
+        return tmp_path / "file.txt"
+
+    def test_valid_path(self, file_path: Path) -> None:
         """Given a valid writable path, does not raise."""
-        file_path = tmp_path / "file.txt"
         validate_file_path(file_path)
         validate_file_path(str(file_path))
 
@@ -63,13 +243,39 @@ class TestValidateFilePath:
         with pytest.raises(ValueError, match="does not exist"):
             validate_file_path(bad_path)
 
-    def test_non_writable_directory(self, tmp_path: Path) -> None:
+    def test_file_as_parent(self, file_path: Path) -> None:
+        """Given a parent that is a regular file, raises ValueError."""
+        file_path.touch()
+        with pytest.raises(ValueError, match="is not a directory"):
+            validate_file_path(file_path / "file.wav")
+        with pytest.raises(ValueError, match="does not exist"):
+            validate_file_path(file_path / "subdir" / "file.wav")
+
+    def test_inaccessible_directory(self, file_path: Path) -> None:
+        """Given a directory that cannot be searched, raises ValueError."""
+        with (
+            patch("os.stat", side_effect=PermissionError),
+            pytest.raises(ValueError, match="is not accessible"),
+        ):
+            validate_file_path(file_path)
+
+    def test_non_writable_directory(self, file_path: Path) -> None:
         """Given a non-writable directory, raises ValueError."""
+        dir_stat = file_path.parent.stat()
+        read_only = os.stat_result((stat.S_IFDIR | 0o555, *dir_stat[1:]))
         with (
+            patch("os.stat", return_value=read_only),
             patch("os.access", return_value=False),
             pytest.raises(ValueError, match="is not writable"),
         ):
-            validate_file_path(tmp_path / "file.txt")
+            validate_file_path(file_path)
+
+    @pytest.mark.skipif(not hasattr(os, "geteuid"), reason="Requires POSIX user IDs")
+    def test_owned_directory_skips_access_check(self, file_path: Path) -> None:
+        """Given a directory writable by its owner, os.access is not needed."""
+        with patch("os.access") as access:
+            validate_file_path(file_path)
+        access.assert_not_called()
 
     def test_empty_string(self) -> None:
         """Given an empty string, raises ValueError."""
@@ -23,13 +23,20 @@ from openvoicepacks.providers import Provider
 from openvoicepacks.voicemodel import VoiceModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def set_locale() -> Generator[Callable[[str], None]]:
-    """Fixture to temporarily set and restore locale."""
+    """Fixture to set the locale, skipping unavailable locales.
+
+    The original locale is restored once the module's tests have finished, so tests
+    relying on a particular locale must set it themselves.
+    """
     orig = locale.setlocale(locale.LC_ALL)
 
     def _set(new_locale: str) -> None:
-        locale.setlocale(locale.LC_ALL, new_locale)
+        try:
+            locale.setlocale(locale.LC_ALL, new_locale)
+        except locale.Error:
+            pytest.skip(f"Locale {new_locale} is not available")
 
     yield _set
     locale.setlocale(locale.LC_ALL, orig)
@@ -45,9 +52,9 @@ class TestVoiceModel:
         )
         assert vm.provider.__class__ == Provider.__class__
 
-    def test_locale(self, set_locale: Callable[[str], None]) -> None:
+    @pytest.mark.parametrize("lang", ["en_GB", "en_US", "de_DE"])
+    def test_locale(self, set_locale: Callable[[str], None], lang: str) -> None:
         """Given no language, system locale is used."""
-        lang = "en_GB"
         set_locale(lang)
         vm = VoiceModel(
             provider="generic",
@@ -80,10 +87,17 @@ class TestVoiceModelValidation:
         with pytest.raises(ValueError, match=f"Invalid option: {option}"):
             VoiceModel(voice="Test", provider="generic", option=option)
 
-    @pytest.mark.parametrize(
-        "language", ["en", "enGB", "en_GB_en", "en--GB", "_GB", "en_", "en_GB.UTF8"]
-    )
-    def test_invalid_language_format(self, language: str) -> None:
+    def test_invalid_language_format(self) -> None:
         """Given an invalid language format, a ValueError is raised."""
-        with pytest.raises(ValueError, match="must be in the format"):
-            VoiceModel(voice="Test", provider="generic", language=language)
+        # Checked in a loop, as parametrising cases this cheap costs more than the test.
+        for language in (
+            "en",  # Too short
+            "enGB",  # No separator
+            "en_GB_en",  # Too many parts
+            "en--GB",  # Dashes
+            "_GB",  # Leading underscore
+            "en_",  # Trailing underscore
+            "en_GB.UTF8",  # With codec
+        ):
+            with pytest.raises(ValueError, match="must be in the format"):
+                VoiceModel(voice="Test", provider="generic", language=language)
@@ -1,36 +1,101 @@
 """Unit tests for VoicePack classes and wrapper in openvoicepacks.voicepack.
 
 Current tests:
-- Initialization of VoicePack objects with minimal and full parameters.
-- Validation of the worklist() method for flat and nested sound dictionaries.
+- Initialization of VoicePack objects with minimal and full parameters, defaults,
+  packname normalisation and voice models given as dicts, using sample data shared
+  within the module.
+- Validation of the worklist() method for empty, flat, nested, interleaved and deeply
+  nested sound dictionaries.
+- Lazy iteration of sounds with iter_worklist().
+- Building voice packs from flat lists of sound files with from_soundfiles(),
+  including repeated paths and later changes to sounds.
+- Concurrent synthesis of all sounds with synthesise_all().
+- Asynchronous synthesis of all sounds with async_synthesise_all().
+- YAML output, voice model round trip and schema.
+- Saving to a file, a default filename and a text stream.
+- Merging voice packs without changing their parents.
+- Parsing CSV data from strings, bytes and files, streaming sound files, and
+  rejecting CSV without the required fields.
+- Loading YAML with and without libyaml, from a dict, and caching parsed strings
+  and files, including unusable cache files and bounding both caches.
 """
 
+import asyncio
+import hashlib
 import io
-from datetime import datetime
+import os
+import pickle
+from datetime import UTC, datetime
 from pathlib import Path
 from textwrap import dedent
+from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
 
-from openvoicepacks.audio import SoundFile
-from openvoicepacks.voicepack import VoicePack, voicepack_from_csv, voicepack_from_yaml
+from openvoicepacks import voicepack
+from openvoicepacks.audio import AudioData, SoundFile
+from openvoicepacks.providers import Provider
+from openvoicepacks.voicemodel import VoiceModel
+from openvoicepacks.voicepack import (
+    VoicePack,
+    soundfiles_from_csv,
+    voicepack_from_csv,
+    voicepack_from_yaml,
+)
+
+# Load and dump test YAML with libyaml when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@pytest.fixture(scope="module")
+def sample_data() -> dict[str, str | int]:
+    """Sample YAML data for testing, shared within the module so do not modify."""
+    return {
+        "ovp_schema": 1,
+        "name": "test with space",
+        "description": "Default English (UK) voice pack",
+        "creator": "Your Name",
+        "contact": "yourname@youremail.local",
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_voicepack(sample_data: dict[str, str | int]) -> VoicePack:
+    """VoicePack built from the sample data, shared so do not modify."""
+    return VoicePack(**sample_data)
+
+
+@pytest.fixture(scope="module")
+def sample_voicepack_yaml(sample_voicepack: VoicePack) -> str:
+    """YAML output of the sample VoicePack, rendered once for the module."""
+    return sample_voicepack.yaml()
+
+
+@pytest.fixture(scope="module")
+def voicepack_dict() -> dict:
+    """Reusable dict for YAML/JSON tests, shared within the module so do not modify."""
+    return {
+        "ovp_schema": 1,
+        "name": "TestPack",
+        "description": "A test pack",
+        "sounds": {
+            "hello": "Hello",
+            "alerts": {"goodbye": "Goodbye"},
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def voicepack_yaml(voicepack_dict: dict) -> str:
+    """The reusable dict dumped to YAML once for the module."""
+    return yaml.dump(voicepack_dict, Dumper=YAML_DUMPER)
 
 
 class TestVoicePack:
     """Tests for the VoicePack wrapper class."""
 
-    @pytest.fixture
-    def sample_data(self) -> dict[str, str | int]:
-        """Sample YAML data for testing."""
-        return {
-            "ovp_schema": 1,
-            "name": "test with space",
-            "description": "Default English (UK) voice pack",
-            "creator": "Your Name",
-            "contact": "yourname@youremail.local",
-        }
-
     class TestInitialisation:
         """Tests for VoicePack initialisation."""
 
@@ -46,85 +111,280 @@ class TestVoicePack:
             assert vp.packname == sample_data["name"].replace(" ", "_")
             assert isinstance(vp.creation_date, datetime)
 
+        @pytest.mark.parametrize(
+            ("name", "packname"),
+            [
+                ("My Pack", "my_pack"),
+                ("packs/Pack.yaml", "pack"),
+                ("pack.tar.gz", "pack.tar"),
+                (".hidden", ".hidden"),
+                ("pack/", "pack"),
+            ],
+        )
+        def test_packname(self, name: str, packname: str) -> None:
+            """Given a name, packname is its lowercase stem with underscores."""
+            assert VoicePack(name=name).packname == packname
+
+        def test_empty_packname(self) -> None:
+            """Given an empty name, ValueError is raised."""
+            with pytest.raises(ValueError, match="empty name"):
+                VoicePack(name="")
+
+        def test_defaults_not_shared(self) -> None:
+            """Given default sounds and based_on, each VoicePack has its own."""
+            first, second = VoicePack(name="first"), VoicePack(name="second")
+            first.sounds["hello"] = "Hello"
+            first.based_on.append("parent")
+            assert second.sounds == {}
+            assert second.based_on == []
+
+        def test_creation_date_is_now(self) -> None:
+            """Given no creation date, it is set when the VoicePack is created."""
+            before = datetime.now(UTC)
+            vp = VoicePack(name="test")
+            assert before <= vp.creation_date <= datetime.now(UTC)
+
+        def test_model_from_dict(self) -> None:
+            """Given a voice model dict, it is converted to a VoiceModel."""
+            model = {"provider": "generic", "voice": "test", "language": "en_GB"}
+            vp = VoicePack(name="test", model=model)
+            assert isinstance(vp.model, VoiceModel)
+            assert vp.model.voice == "test"
+
     class TestWorklist:
         """Tests for VoicePack worklist method."""
 
-        def test_empty_sounds(self) -> None:
-            """Given no sounds, worklist returns empty list."""
-            vp = VoicePack(name="test")
-            worklist = vp.worklist()
+        @pytest.mark.parametrize(
+            ("sounds", "expected"),
+            [
+                ({}, []),
+                (
+                    {"greeting": "hello", "farewell": "goodbye"},
+                    [("greeting", "hello"), ("farewell", "goodbye")],
+                ),
+                (
+                    {
+                        "morning": {
+                            "greeting": "good morning",
+                            "farewell": "see you later",
+                        },
+                        "evening": {
+                            "greeting": "good evening",
+                            "farewell": "good night",
+                        },
+                        "greeting": "hello",
+                        "farewell": "goodbye",
+                    },
+                    [
+                        ("MORNING/greeting", "good morning"),
+                        ("MORNING/farewell", "see you later"),
+                        ("EVENING/greeting", "good evening"),
+                        ("EVENING/farewell", "good night"),
+                        ("greeting", "hello"),
+                        ("farewell", "goodbye"),
+                    ],
+                ),
+            ],
+            ids=["empty", "flat", "nested"],
+        )
+        def test_sounds(self, sounds: dict, expected: list[tuple[str, str]]) -> None:
+            """Given a sounds dict, worklist returns its sound files flattened."""
+            worklist = VoicePack(name="test", sounds=sounds).worklist()
             assert isinstance(worklist, list)
-            assert len(worklist) == 0
+            assert all(isinstance(item, SoundFile) for item in worklist)
+            assert [(item.path, item.text) for item in worklist] == expected
 
-        def test_flat_sounds(self) -> None:
-            """Given flat sounds dict, worklist returns correct list."""
+        def test_interleaved_sounds(self) -> None:
+            """Given sounds before and after nested dicts, dict order is kept."""
             sounds = {
-                "greeting": "hello",
-                "farewell": "goodbye",
+                "first": "one",
+                "system": {"inner": "two", "menu": {"deep": "three"}, "last": "four"},
+                "final": "five",
             }
-            expected = [
-                {"path": "greeting", "text": "hello"},
-                {"path": "farewell", "text": "goodbye"},
+            vp = VoicePack(name="test", sounds=sounds)
+            assert [(item.path, item.text) for item in vp.worklist()] == [
+                ("first", "one"),
+                ("SYSTEM/inner", "two"),
+                ("SYSTEM/MENU/deep", "three"),
+                ("SYSTEM/last", "four"),
+                ("final", "five"),
             ]
+
+        def test_iter_worklist(self) -> None:
+            """Given nested sounds, iter_worklist yields them lazily in order."""
+            sounds = {"first": "one", "system": {"inner": "two"}}
+            vp = VoicePack(name="test", sounds=sounds)
+            sound_files = vp.iter_worklist()
+            assert not isinstance(sound_files, list)
+            assert [sf.path for sf in sound_files] == ["first", "SYSTEM/inner"]
+
+        def test_deeply_nested_sounds(self) -> None:
+            """Given deep nesting, directories are uppercased and leaves are kept."""
+            sounds: dict = {"Leaf": "bottom"}
+            for depth in range(50):
+                sounds = {f"dir{depth}": sounds, f"Top{depth}": "text"}
             vp = VoicePack(name="test", sounds=sounds)
             worklist = vp.worklist()
-            assert isinstance(worklist, list)
-            assert len(worklist) == 2
-            for item, exp in zip(worklist, expected, strict=True):
-                assert isinstance(item, SoundFile)
-                assert item.path == exp["path"]
-                assert item.text == exp["text"]
-
-        def test_nested_sounds(self) -> None:
-            """Given nested sounds dict, worklist returns flattened list."""
-            sounds = {
-                "morning": {
-                    "greeting": "good morning",
-                    "farewell": "see you later",
-                },
-                "evening": {
-                    "greeting": "good evening",
-                    "farewell": "good night",
-                },
-                "greeting": "hello",
-                "farewell": "goodbye",
-            }
-            expected = [
-                {"path": "MORNING/greeting", "text": "good morning"},
-                {"path": "MORNING/farewell", "text": "see you later"},
-                {"path": "EVENING/greeting", "text": "good evening"},
-                {"path": "EVENING/farewell", "text": "good night"},
-                {"path": "greeting", "text": "hello"},
-                {"path": "farewell", "text": "goodbye"},
+            assert len(worklist) == 51
+            directories = "/".join(f"DIR{depth}" for depth in reversed(range(50)))
+            assert worklist[0].path == f"{directories}/Leaf"
+            assert worklist[-1].path == "Top49"
+
+    class TestFromSoundFiles:
+        """Tests for the VoicePack from_soundfiles constructor."""
+
+        @pytest.fixture
+        def sound_files(self) -> list[SoundFile]:
+            """Return a flat list of sound files."""
+            return [
+                SoundFile(path="hello", text="Hello"),
+                SoundFile(path="SYSTEM/goodbye", text="Goodbye"),
             ]
-            vp = VoicePack(name="test", sounds=sounds)
+
+        def test_sounds(self, sound_files: list[SoundFile]) -> None:
+            """Given sound files, the nested sounds dict is built from their paths."""
+            vp = VoicePack.from_soundfiles("test", sound_files, creator="Me")
+            assert vp.creator == "Me"
+            assert vp.sounds == {"hello": "Hello", "system": {"goodbye": "Goodbye"}}
+
+        def test_worklist(self, sound_files: list[SoundFile]) -> None:
+            """Given sound files, worklist returns fresh copies of them each call."""
+            vp = VoicePack.from_soundfiles("test", sound_files)
             worklist = vp.worklist()
-            assert isinstance(worklist, list)
-            assert len(worklist) == 6
-            for item, exp in zip(worklist, expected, strict=True):
-                assert isinstance(item, SoundFile)
-                assert item.path == exp["path"]
-                assert item.text == exp["text"]
+            assert worklist == sound_files
+            assert worklist[0] is not sound_files[0]
+            worklist[0].audio = object()
+            assert vp.worklist()[0].audio is None
+
+        def test_directory_is_one_key(self) -> None:
+            """Given a path with several directories, they form a single sounds key."""
+            vp = VoicePack.from_soundfiles(
+                "test", [SoundFile(path="A/B/hi", text="Hi")]
+            )
+            assert vp.sounds == {"a/b": {"hi": "Hi"}}
+            assert vp.worklist() == [SoundFile(path="A/B/hi", text="Hi")]
+
+        def test_duplicate_paths(self) -> None:
+            """Given a repeated path, the worklist has it once, with the last text."""
+            vp = VoicePack.from_soundfiles(
+                "test",
+                [
+                    SoundFile(path="hello", text="Hello"),
+                    SoundFile(path="hello", text="Hi"),
+                ],
+            )
+            assert vp.worklist() == [SoundFile(path="hello", text="Hi")]
+
+        def test_sounds_edited(self, sound_files: list[SoundFile]) -> None:
+            """Given sounds is edited in place, worklist reflects the change."""
+            vp = VoicePack.from_soundfiles("test", sound_files)
+            vp.sounds["system"]["extra"] = "Extra"
+            assert [sf.path for sf in vp.worklist()] == [
+                "hello",
+                "SYSTEM/goodbye",
+                "SYSTEM/extra",
+            ]
+
+        def test_sounds_reassigned(self, sound_files: list[SoundFile]) -> None:
+            """Given sounds is reassigned, worklist reflects the new sounds."""
+            vp = VoicePack.from_soundfiles("test", sound_files)
+            vp.sounds = {"other": "Other"}
+            assert [sf.path for sf in vp.worklist()] == ["other"]
+
+    class TestSynthesiseAll:
+        """Tests for VoicePack synthesise_all method."""
+
+        @pytest.fixture
+        def voicepack(self) -> VoicePack:
+            """Return a voice pack using the generic provider."""
+            model = {"provider": "generic", "voice": "test", "language": "en_GB"}
+            sounds = {"hello": "Hello", "system": {"goodbye": "Goodbye"}}
+            return VoicePack(name="test", model=model, sounds=sounds)
+
+        def test_audio_assigned(self, voicepack: VoicePack) -> None:
+            """Given a provider, every sound file is given its synthesised audio."""
+            provider = Provider()
+            provider._synthesise = MagicMock(
+                side_effect=lambda text, _: AudioData(data=text.encode())
+            )
+            worklist = voicepack.synthesise_all(provider, max_workers=2)
+            assert {sf.path: sf.audio.data for sf in worklist} == {
+                "hello": b"Hello",
+                "SYSTEM/goodbye": b"Goodbye",
+            }
+
+        def test_failures_have_no_audio(self, voicepack: VoicePack) -> None:
+            """Given a sound fails to synthesise, it is left without audio."""
+            provider = Provider()
+            provider._synthesise = MagicMock(side_effect=RuntimeError("failed"))
+            worklist = voicepack.synthesise_all(provider)
+            assert all(sf.audio is None for sf in worklist)
+
+        def test_no_model(self) -> None:
+            """Given no voice model, ValueError is raised."""
+            with pytest.raises(ValueError, match="no voice model"):
+                VoicePack(name="test").synthesise_all()
+
+    class TestAsyncSynthesiseAll:
+        """Tests for VoicePack async_synthesise_all method."""
+
+        @pytest.fixture
+        def voicepack(self) -> VoicePack:
+            """Return a voice pack using the generic provider."""
+            model = {"provider": "generic", "voice": "test", "language": "en_GB"}
+            sounds = {"hello": "Hello", "system": {"goodbye": "Goodbye"}}
+            return VoicePack(name="test", model=model, sounds=sounds)
+
+        def test_audio_assigned(self, voicepack: VoicePack) -> None:
+            """Given a provider, every sound file is given its synthesised audio."""
+            provider = Provider()
+            provider._synthesise = MagicMock(
+                side_effect=lambda text, _: AudioData(data=text.encode())
+            )
+            worklist = asyncio.run(voicepack.async_synthesise_all(provider, 2))
+            assert {sf.path: sf.audio.data for sf in worklist} == {
+                "hello": b"Hello",
+                "SYSTEM/goodbye": b"Goodbye",
+            }
+
+        def test_failures_have_no_audio(self, voicepack: VoicePack) -> None:
+            """Given a sound fails to synthesise, it is left without audio."""
+            provider = Provider()
+            provider._synthesise = MagicMock(side_effect=RuntimeError("failed"))
+            worklist = asyncio.run(voicepack.async_synthesise_all(provider))
+            assert all(sf.audio is None for sf in worklist)
+
+        def test_no_model(self) -> None:
+            """Given no voice model, ValueError is raised."""
+            with pytest.raises(ValueError, match="no voice model"):
+                asyncio.run(VoicePack(name="test").async_synthesise_all())
 
     class TestYAML:
         """Tests for VoicePack YAML output."""
 
-        def test_yaml_output(self, sample_data: dict[str, str | int]) -> None:
+        def test_yaml_output(
+            self, sample_data: dict[str, str | int], sample_voicepack_yaml: str
+        ) -> None:
             """Given a VoicePack, yaml() returns expected YAML string."""
-            vp = VoicePack(**sample_data)
-            yaml_str = vp.yaml()
-            assert isinstance(yaml_str, str)
-            yaml_data = yaml.safe_load(yaml_str)
+            assert isinstance(sample_voicepack_yaml, str)
+            yaml_data = yaml.load(sample_voicepack_yaml, Loader=YAML_LOADER)  # NOQA: S506
             assert yaml_data["name"] == sample_data["name"]
             assert yaml_data["description"] == sample_data["description"]
             assert yaml_data["creator"] == sample_data["creator"]
             assert yaml_data["contact"] == sample_data["contact"]
 
-        def test_yaml_schema(self, sample_data: dict[str, str | int]) -> None:
+        def test_yaml_model_round_trip(self, sample_data: dict[str, str | int]) -> None:
+            """Given a VoicePack with a model, its YAML loads back to the same model."""
+            model = {"provider": "generic", "voice": "test", "language": "en_GB"}
+            vp = VoicePack(**sample_data, model=model)
+            loaded = voicepack_from_yaml(vp.yaml())
+            assert loaded.model == vp.model
+
+        def test_yaml_schema(
+            self, sample_data: dict[str, str | int], sample_voicepack_yaml: str
+        ) -> None:
             """Given a VoicePack, the YAML output conforms to the schema."""
-            vp = VoicePack(**sample_data)
-            yaml_str = vp.yaml()
-            yaml_data = yaml.safe_load(yaml_str)
+            yaml_data = yaml.load(sample_voicepack_yaml, Loader=YAML_LOADER)  # NOQA: S506
             # This will raise ValidationError if the schema does not match
             model = VoicePack(**yaml_data)
             assert model.name == sample_data["name"]
@@ -138,34 +398,53 @@ class TestVoicePack:
             return str(tmp_path / "test_voicepack.yaml")
 
         @pytest.fixture
-        def default_file_path(self, sample_data: dict[str, str | int]) -> str:
-            """Default file path derived from packname."""
-            packname = f"{sample_data['name'].replace(' ', '_')}.yaml"
-            yield packname
-            Path(packname).unlink(missing_ok=True)
+        def default_file_path(
+            self,
+            sample_data: dict[str, str | int],
+            tmp_path: Path,
+            monkeypatch: pytest.MonkeyPatch,
+        ) -> str:
+            """Default file path derived from packname, within a temporary directory.
+
+            The working directory is changed, so parallel test workers never share the
+            default file.
+            """
+            monkeypatch.chdir(tmp_path)
+            return f"{sample_data['name'].replace(' ', '_')}.yaml"
 
         def test_save_creates_file(
-            self, sample_data: dict[str, str | int], tmp_file_path: str
+            self,
+            sample_data: dict[str, str | int],
+            sample_voicepack: VoicePack,
+            tmp_file_path: str,
         ) -> None:
             """Given a filename, save() creates a YAML file."""
-            vp = VoicePack(**sample_data)
-            saved_path = vp.save(tmp_file_path)
+            saved_path = sample_voicepack.save(tmp_file_path)
             assert saved_path == tmp_file_path
-            with Path.open(saved_path, encoding="utf-8") as f:
-                yaml_data = yaml.safe_load(f.read())
+            saved = Path(saved_path).read_text(encoding="utf-8")
+            yaml_data = yaml.load(saved, Loader=YAML_LOADER)  # NOQA: S506
             assert yaml_data["name"] == sample_data["name"]
 
         def test_save_default_filename(
-            self, sample_data: dict[str, str | int], default_file_path: str
+            self,
+            sample_data: dict[str, str | int],
+            sample_voicepack: VoicePack,
+            default_file_path: str,
         ) -> None:
             """Given no filename, save() uses default derived from packname."""
-            vp = VoicePack(**sample_data)
-            saved_path = vp.save()
+            saved_path = sample_voicepack.save()
             assert saved_path == default_file_path
-            with Path.open(saved_path, encoding="utf-8") as f:
-                yaml_data = yaml.safe_load(f.read())
+            saved = Path(saved_path).read_text(encoding="utf-8")
+            yaml_data = yaml.load(saved, Loader=YAML_LOADER)  # NOQA: S506
             assert yaml_data["name"] == sample_data["name"]
 
+        def test_save_matches_yaml(self, sample_data: dict[str, str | int]) -> None:
+            """Given a text stream, save() writes the same YAML as yaml() to it."""
+            vp = VoicePack(**sample_data, sounds={"hello": "Hello"})
+            buffer = io.StringIO()
+            assert vp.save(buffer) is buffer
+            assert buffer.getvalue() == vp.yaml()
+
     class TestMerge:
         """Tests for VoicePack merge method."""
 
@@ -205,24 +484,97 @@ class TestVoicePack:
             child_vp.merge(parent_vp)
             assert child_vp.sounds == expected_sounds
 
+        def test_merge_does_not_change_parents(self) -> None:
+            """Given several parents, merging later ones leaves earlier ones intact."""
+            first = VoicePack(name="first", sounds={"alerts": {"low": "low"}})
+            second = VoicePack(name="second", sounds={"alerts": {"lost": "lost"}})
+            child = VoicePack(name="child")
+            child.merge(first)
+            child.merge(second)
+            assert child.sounds == {"alerts": {"low": "low", "lost": "lost"}}
+            assert first.sounds == {"alerts": {"low": "low"}}
+            assert child.based_on == ["first", "second"]
+
+        def test_merge_updates_worklist(self) -> None:
+            """Given a voice pack built from sound files, merge updates its worklist."""
+            child = VoicePack.from_soundfiles(
+                "child", [SoundFile(path="hello", text="Hello")]
+            )
+            child.merge(VoicePack(name="parent", sounds={"bye": "Bye"}))
+            assert [sf.path for sf in child.worklist()] == ["hello", "bye"]
+
 
 class TestVoicePackFromCSV:
     """Tests for voicepack_from_csv utility."""
 
+    CSV_CONTENT = dedent("""\
+        "String ID","Source text","Filename","Path","Translation"
+        "1","0","morning.wav","","Morning"
+        "2","1","afternoon.wav","alerts","Afternoon"
+        "3","1","night.wav","alerts","Night"
+    """)
+    # Only the required columns, as CSV files may leave the others out.
+    MINIMAL_CSV = dedent("""\
+        "Filename","Path","Translation"
+        "morning.wav","","Morning"
+        "night.wav","alerts","Night"
+    """)
+
     def test_valid_csv(self) -> None:
         """Given valid CSV data, returns a VoicePack object with expected fields."""
-        csv_content = dedent("""\
-            "String ID","Source text","Filename","Path","Translation"
-            "1","0","morning.wav","","Morning"
-            "2","1","afternoon.wav","alerts","Afternoon"
-            "3","1","night.wav","alerts","Night"
-        """)
-        csv_data = io.StringIO(csv_content)
+        csv_data = io.StringIO(self.CSV_CONTENT)
         vp = voicepack_from_csv(csv_data)
         assert hasattr(vp, "sounds")
         assert vp.sounds["morning"] == "Morning"
         assert vp.sounds["alerts"]["afternoon"] == "Afternoon"
         assert vp.sounds["alerts"]["night"] == "Night"
+        assert [sf.path for sf in vp.worklist()] == [
+            "morning",
+            "ALERTS/afternoon",
+            "ALERTS/night",
+        ]
+
+    def test_csv_bytes(self) -> None:
+        """Given CSV data as UTF-8 bytes, it is decoded and read."""
+        vp = voicepack_from_csv(self.CSV_CONTENT.encode("utf-8"))
+        assert vp.sounds["alerts"]["night"] == "Night"
+
+    def test_wav_suffix_only(self) -> None:
+        """Given a filename containing .wav, only the suffix is removed."""
+        csv_content = (
+            '"Filename","Path","Translation"\n"a.wav.backup.wav","","Backup"\n'
+        )
+        vp = voicepack_from_csv(csv_content)
+        assert vp.sounds == {"a.wav.backup": "Backup"}
+
+    def test_path_is_one_key(self) -> None:
+        """Given a Path containing a slash, it is kept as a single directory key."""
+        csv_content = '"Filename","Path","Translation"\n"low.wav","Alerts/Bat","Low"\n'
+        vp = voicepack_from_csv(csv_content)
+        assert vp.sounds == {"alerts/bat": {"low": "Low"}}
+
+    def test_soundfiles_streamed(self) -> None:
+        """Given CSV data, sound files are yielded as each row is read."""
+        sound_files = soundfiles_from_csv(self.MINIMAL_CSV)
+        assert next(sound_files) == SoundFile(path="morning", text="Morning")
+        assert next(sound_files) == SoundFile(path="ALERTS/night", text="Night")
+        assert next(sound_files, None) is None
+
+    def test_csv_file(self, tmp_path: Path) -> None:
+        """Given a path to a CSV file, it is read into a VoicePack."""
+        csv_file = tmp_path / "pack.csv"
+        csv_file.write_text('"Filename","Path","Translation"\n"hi.wav","sys","Hi"\n')
+        assert voicepack_from_csv(csv_file).sounds == {"sys": {"hi": "Hi"}}
+
+    def test_blank_lines(self) -> None:
+        """Given CSV data with blank lines, they are skipped."""
+        csv_content = '"Filename","Path","Translation"\n\n"hello.wav","","Hello"\n\n'
+        assert voicepack_from_csv(csv_content).sounds == {"hello": "Hello"}
+
+    def test_empty_csv(self) -> None:
+        """Given empty CSV data, raises ValueError."""
+        with pytest.raises(ValueError, match="CSV not formatted correctly"):
+            voicepack_from_csv("")
 
     def test_missing_field(self) -> None:
         """Given CSV missing required fields, raises ValueError."""
@@ -235,23 +587,153 @@ class TestVoicePackFromCSV:
 class TestVoicePackFromYAML:
     """Tests for voicepack_from_yaml utility."""
 
-    @pytest.fixture
-    def voicepack_dict(self) -> dict:
-        """Reusable dict for YAML/JSON tests."""
-        return {
-            "ovp_schema": 1,
-            "name": "TestPack",
-            "description": "A test pack",
-            "sounds": {
-                "hello": "Hello",
-                "alerts": {"goodbye": "Goodbye"},
-            },
-        }
-
-    def test_valid_yaml(self, voicepack_dict: dict) -> None:
+    def test_valid_yaml(self, voicepack_dict: dict, voicepack_yaml: str) -> None:
         """Given valid YAML, returns a VoicePack object matching the dict."""
-        yaml_data = yaml.dump(voicepack_dict)
-        vp = voicepack_from_yaml(yaml_data)
+        vp = voicepack_from_yaml(voicepack_yaml)
+        assert vp.name == voicepack_dict["name"]
+        assert vp.description == voicepack_dict["description"]
+        assert vp.sounds == voicepack_dict["sounds"]
+
+    def test_dict_construction(self, voicepack_dict: dict) -> None:
+        """Given the parsed dict, VoicePack builds it directly, as for JSON configs."""
+        vp = VoicePack(**voicepack_dict)
         assert vp.name == voicepack_dict["name"]
         assert vp.description == voicepack_dict["description"]
         assert vp.sounds == voicepack_dict["sounds"]
+
+    class TestYAMLFile:
+        """Tests for loading YAML files through the parsed YAML cache."""
+
+        @pytest.fixture
+        def yaml_file(
+            self, voicepack_yaml: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        ) -> Path:
+            """Return a voice pack YAML file, caching in a temporary directory."""
+            monkeypatch.setenv("OVP_CACHE_DIR", str(tmp_path / "cache"))
+            yaml_file = tmp_path / "pack.yaml"
+            yaml_file.write_text(voicepack_yaml, encoding="utf-8")
+            return yaml_file
+
+        def test_cache_hit(self, yaml_file: Path, voicepack_dict: dict) -> None:
+            """Given an unchanged file, a second load skips parsing it."""
+            with patch.object(yaml, "load", wraps=yaml.load) as load:
+                voicepack_from_yaml(yaml_file)
+                vp = voicepack_from_yaml(yaml_file)
+            load.assert_called_once()
+            assert vp.sounds == voicepack_dict["sounds"]
+
+        def test_changed_file(self, yaml_file: Path, voicepack_dict: dict) -> None:
+            """Given the file changes, it is parsed again."""
+            voicepack_from_yaml(yaml_file)
+            renamed = {**voicepack_dict, "name": "Renamed Pack"}
+            yaml_file.write_text(
+                yaml.dump(renamed, Dumper=YAML_DUMPER), encoding="utf-8"
+            )
+            assert voicepack_from_yaml(yaml_file).name == "Renamed Pack"
+
+        def test_corrupt_cache(self, yaml_file: Path, tmp_path: Path) -> None:
+            """Given an unreadable cache file, the file is parsed again."""
+            voicepack_from_yaml(yaml_file)
+            for cache_file in (tmp_path / "cache" / "yaml").iterdir():
+                cache_file.write_bytes(b"OVPv1\nnot a pickle")
+            assert voicepack_from_yaml(yaml_file).name == "TestPack"
+
+        @pytest.mark.parametrize(
+            "cached",
+            [
+                pickle.dumps("wrong shape"),  # ValueError when unpacked
+                pickle.dumps(None),  # TypeError when unpacked
+                b"copenvoicepacks.voicepack\nMissing\n.",  # AttributeError
+                b"cmissing_module\nMissing\n.",  # ModuleNotFoundError
+            ],
+            ids=["wrong_length", "wrong_type", "moved_class", "moved_module"],
+        )
+        def test_outdated_cache(
+            self, yaml_file: Path, tmp_path: Path, cached: bytes
+        ) -> None:
+            """Given a cache that unpickles badly, the file is parsed and recached."""
+            voicepack_from_yaml(yaml_file)
+            cache_files = list((tmp_path / "cache" / "yaml").iterdir())
+            for cache_file in cache_files:
+                cache_file.write_bytes(b"OVPv1\n" + cached)
+            assert voicepack_from_yaml(yaml_file).name == "TestPack"
+            for cache_file in cache_files:
+                _, data = pickle.loads(cache_file.read_bytes()[len(b"OVPv1\n") :])  # NOQA: S301
+                assert data["name"] == "TestPack"
+
+        def test_cache_pruned(
+            self,
+            yaml_file: Path,
+            voicepack_yaml: str,
+            tmp_path: Path,
+            monkeypatch: pytest.MonkeyPatch,
+        ) -> None:
+            """Given more files than the cache holds, the least recently used go."""
+            monkeypatch.setattr(voicepack, "_YAML_CACHE_FILES", 2)
+            other_file, new_file = tmp_path / "other.yaml", tmp_path / "new.yaml"
+            for path in (other_file, new_file):
+                path.write_text(voicepack_yaml, encoding="utf-8")
+
+            def cache_file(path: Path) -> Path:
+                key = hashlib.sha256(os.fsencode(path.resolve())).hexdigest()
+                return tmp_path / "cache" / "yaml" / f"{key}.pickle"
+
+            voicepack_from_yaml(yaml_file)
+            voicepack_from_yaml(other_file)
+            os.utime(cache_file(yaml_file), (1, 1))
+            os.utime(cache_file(other_file), (2, 2))
+            voicepack_from_yaml(yaml_file)  # A hit marks it as recently used
+            voicepack_from_yaml(new_file)
+            assert cache_file(yaml_file).exists()
+            assert not cache_file(other_file).exists()
+            assert cache_file(new_file).exists()
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="Requires libyaml")
+    def test_libyaml_loader(self, voicepack_yaml: str) -> None:
+        """Given PyYAML was built with libyaml, the C loader is used."""
+        with patch.object(yaml, "load", wraps=yaml.load) as load:
+            voicepack_from_yaml(io.StringIO(voicepack_yaml))
+        assert load.call_args.kwargs["Loader"] is yaml.CSafeLoader
+
+    def test_without_libyaml(
+        self,
+        voicepack_dict: dict,
+        voicepack_yaml: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Given PyYAML was built without libyaml, the Python loader is used."""
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        vp = voicepack_from_yaml(io.StringIO(voicepack_yaml))
+        assert vp.sounds == voicepack_dict["sounds"]
+
+    def test_parse_cached(self, voicepack_dict: dict) -> None:
+        """Given the same YAML twice, it is parsed once and not shared."""
+        yaml_data = yaml.dump(
+            {**voicepack_dict, "name": "CachedPack"}, Dumper=YAML_DUMPER
+        )
+        with patch.object(yaml, "load", wraps=yaml.load) as load:
+            first = voicepack_from_yaml(yaml_data)
+            first.sounds["alerts"]["goodbye"] = "Changed"
+            second = voicepack_from_yaml(yaml_data)
+        load.assert_called_once()
+        assert second.sounds == voicepack_dict["sounds"]
+        assert all(len(key) == 16 for key in voicepack._parsed_yaml)  # Digests only
+
+    def test_parse_cache_bounded(
+        self, voicepack_dict: dict, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Given more YAML than the parse cache holds, the oldest is forgotten."""
+        monkeypatch.setattr(voicepack, "_PARSED_YAML_SIZE", 2)
+        monkeypatch.setattr(voicepack, "_parsed_yaml", {})
+        documents = [
+            yaml.dump({**voicepack_dict, "name": name}, Dumper=YAML_DUMPER)
+            for name in ("First", "Second", "Third")
+        ]
+        for document in documents:
+            voicepack_from_yaml(document)
+        assert len(voicepack._parsed_yaml) == 2
+        with patch.object(yaml, "load", wraps=yaml.load) as load:
+            assert voicepack_from_yaml(documents[2]).name == "Third"
+            load.assert_not_called()
+            assert voicepack_from_yaml(documents[0]).name == "First"
+            load.assert_called_once()
@@ -0,0 +1,67 @@
+"""Tests for the worker module.
+
+Current tests:
+- Processing a worklist in parallel.
+- Collecting items whose task failed.
+- Consuming a generator worklist a few items at a time.
+"""
+
+import threading
+from collections.abc import Generator
+
+import pytest
+
+from openvoicepacks import worker
+
+
+class TestProcessQueue:
+    """Tests for the process_queue function."""
+
+    def test_all_items_processed(self) -> None:
+        """Given a worklist, the task is called once for each item."""
+        seen = []
+        lock = threading.Lock()
+
+        def task(item: int) -> None:
+            with lock:
+                seen.append(item)
+
+        assert worker.process_queue(task, range(20), workers=4) == []
+        assert sorted(seen) == list(range(20))
+
+    def test_failed_items_returned(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Given a task that raises, the failing items are returned and logged."""
+
+        def task(item: int) -> None:
+            if item % 2:
+                raise ValueError(item)
+
+        failed = worker.process_queue(task, range(6), workers=2)
+        assert sorted(failed) == [1, 3, 5]
+        assert "Failed to process 1" in caplog.text
+
+    def test_bounded_queue(self) -> None:
+        """Given a generator worklist, only a few items are queued per worker."""
+        lock = threading.Lock()
+        pulled = done = most_queued = 0
+
+        def worklist() -> Generator[int]:
+            nonlocal pulled
+            for item in range(50):
+                with lock:
+                    pulled += 1
+                yield item
+
+        def task(_: int) -> None:
+            nonlocal done, most_queued
+            with lock:
+                most_queued = max(most_queued, pulled - done)
+                done += 1
+
+        assert worker.process_queue(task, worklist(), workers=2) == []
+        assert done == 50
+        assert most_queued <= 2 * worker.QUEUE_DEPTH
+
+    def test_default_workers(self) -> None:
+        """Given no worker count, at least one worker is used."""
+        assert worker.default_workers() >= 1